@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Persistent disk cache for slow SEC / Yahoo Finance lookups
+Entries are stored as JSON files under ~/.cache/fin_extractor/{endpoint}/
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import wraps
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "fin_extractor"
+
+
+def _json_default(value):
+    """Convert numpy scalars / timestamps into JSON friendly values"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class FileCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        """Initialize the cache rooted at cache_dir"""
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, endpoint, key):
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / endpoint / f"{digest}.json"
+
+    def get(self, endpoint, key, ttl):
+        """Return cached data, or None if missing or older than ttl seconds"""
+        path = self._entry_path(endpoint, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('ts', 0) > ttl:
+            return None
+        return entry.get('data')
+
+    def set(self, endpoint, key, data):
+        """Store data for (endpoint, key) in a {"ts": ..., "data": ...} envelope"""
+        path = self._entry_path(endpoint, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'ts': time.time(), 'data': data}, f, default=_json_default)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️  Could not write cache entry for {endpoint}: {e}")
+
+    def cached(self, ttl):
+        """Decorator caching a function's (non-empty) result for ttl seconds"""
+        def decorator(func):
+            endpoint = func.__name__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = json.dumps([func.__name__, args, kwargs], sort_keys=True, default=str)
+                data = self.get(endpoint, key, ttl)
+                if data is not None:
+                    return data
+
+                data = func(*args, **kwargs)
+                # Failed lookups return None / [] - don't pin those for the whole TTL
+                if data:
+                    self.set(endpoint, key, data)
+                return data
+
+            return wrapper
+        return decorator
+
+
+_default_cache = FileCache()
+
+
+def cached(ttl):
+    """Cache a function's result in the default on-disk cache for ttl seconds"""
+    return _default_cache.cached(ttl)
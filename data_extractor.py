@@ -6,21 +6,215 @@ Combines SEC Edgar and Yahoo Finance data sources with improved UI
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import threading
+import queue
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 import zipfile
+import shutil
 import tempfile
 import os
 import sys
 from pathlib import Path
-import pandas as pd
 from datetime import datetime, timedelta
+import html
 import json
+import re
 import webbrowser
-import requests
 
 # Import the existing modules
-from sec_finder import FinancialReportFinder
-from yf_finder import DataCenterExtractor
+from cache import cached
+from http_utils import create_session, SEC_RATE_LIMITER
+
+# Cache lifetimes (seconds) for repeated lookups
+TICKER_CACHE_TTL = 60 * 60           # 1 hour for ticker / company lookups
+FILINGS_CACHE_TTL = 24 * 60 * 60     # 24 hours for filings index / periods
+PROGRESS_INTERVAL_MS = 200           # indeterminate progress bar tick
+WHEEL_THROTTLE_MS = 8                # mouse-wheel ticks closer together than this scroll once
+DOWNLOAD_WORKERS = 8                 # shared download pool size (SEC is throttled to 10 req/s)
+SESSION_POOL_SIZE = 32               # keep-alive connections per host (lookup + download pools)
+ZIP_COPY_CHUNK_SIZE = 64 * 1024      # chunk size when streaming downloads to disk / into the ZIP
+ZIP_FAST_COMPRESSLEVEL = 1           # deflate level for "Fast ZIP compression" (zlib default is 6)
+ZIP_DEFAULT_COMPRESSLEVEL = 6
+ZIP_QUEUE_SIZE = 8                   # downloaded files waiting for the single ZIP writer
+ZIP_SPOOL_MAX_MEMORY = 1 << 20       # per-file download buffer before spilling to a temp file
+
+# Resolved once - Path.home() goes through os.environ / pwd
+_DOWNLOADS_DIR = Path.home() / "Downloads"
+_DEFAULT_DOWNLOAD_PATH = str(_DOWNLOADS_DIR / "FinancialData")
+
+# Form type options offered for each data source
+_SEC_FORM_TYPES = (
+    "10-Q (Quarterly Reports)",
+    "10-K (Annual Reports)",
+    "8-K (Current Reports)",
+)
+_YF_FORM_TYPES = (
+    "Annual (Yearly Financial Statements)",
+    "Quarterly (Quarterly Financial Statements)",
+)
+
+# SEC form code for each combobox option
+_FORM_CODE = {
+    "10-Q (Quarterly Reports)": "10-Q",
+    "10-K (Annual Reports)": "10-K",
+    "8-K (Current Reports)": "8-K",
+}
+
+# SEC file type (as listed in the file tree) -> key in generate_financial_report_urls()
+_SEC_URL_KEY = {
+    'Excel Financial Report': 'Excel Financial Report',
+    'Income Statement': 'Income Statement (HTML)',
+    'Balance Sheet': 'Balance Sheet (HTML)',
+    'Cash Flow Statement': 'Cash Flow Statement (HTML)',
+    'Stockholder Equity': 'Stockholder Equity (HTML)',
+}
+
+# Report URL key -> label shown in the advanced preview
+_SEC_URL_DISPLAY = {
+    'Excel Financial Report': '📊 Excel File',
+    'Income Statement (HTML)': '📄 Income Statement',
+    'Balance Sheet (HTML)': '📄 Balance Sheet',
+    'Cash Flow Statement (HTML)': '📄 Cash Flow',
+    'Stockholder Equity (HTML)': '📄 Stockholder Equity',
+}
+
+# Static part of the advanced SEC preview, joined once at import
+_SEC_PROCESSING_DETAILS = "".join([
+    "⚙️ Automatic Processing Details:\n\n",
+    "🔄 Excel File Processing:\n",
+    "1. Download Excel file from SEC EDGAR\n",
+    "2. Analyze sheet structure automatically\n",
+    "3. Identify consolidated financial statements\n",
+    "4. Export consolidated sheets as individual CSV files\n",
+    "5. Preserve original Excel file for reference\n\n",
+
+    "📊 Expected Sheet Categories:\n",
+    "• Cover Page: Filing information and summary\n",
+    "• Consolidated Income Statement: Revenue, expenses, profit\n",
+    "• Consolidated Balance Sheet: Assets, liabilities, equity\n",
+    "• Consolidated Cash Flow: Operating, investing, financing flows\n",
+    "• Notes: Footnotes and additional disclosures\n\n",
+
+    "🎯 Auto-Selection Logic:\n",
+    "• Sheets with 'consolidated' in name are automatically selected\n",
+    "• If no consolidated sheets found, main financial statements are selected\n",
+    "• Cover pages and notes are excluded from auto-selection\n",
+    "• Maximum of 3-5 sheets are auto-exported to prevent clutter\n",
+])
+
+# Per-period lines of the folder structure preview (filled with format_map)
+_SEC_PERIOD_TMPL = (
+    "   └── 📂 {form}/\n"
+    "       └── 📂 {year}/\n"
+    "           ├── 📄 Financial_Report.xlsx\n"
+    "           └── 📄 *_Consolidated_*.csv\n"
+)
+_YF_PERIOD_TMPL = (
+    "   └── 📂 {period_type}/\n"
+    "       └── 📂 {year}/\n"
+    "           ├── 📄 {ticker}-Income_Statement-*.csv\n"
+    "           ├── 📄 {ticker}-Balance_Sheet-*.csv\n"
+    "           └── 📄 {ticker}-Cash_Flow-*.csv\n"
+)
+
+
+# Shared named fonts, created once by _create_fonts() after the Tk root exists
+_FONT_SPECS = {
+    'icon': ('Arial', 24),
+    'title': ('Arial', 18, 'bold'),
+    'h1': ('Arial', 16, 'bold'),
+    'h2': ('Arial', 12, 'bold'),
+    'subtitle': ('Arial', 12, 'italic'),
+    'body': ('Arial', 10),
+    'small': ('Arial', 9),
+}
+_FONTS = {}
+
+# Named ttk label styles: (style, font name, foreground or None)
+_LABEL_STYLES = (
+    ('Icon.TLabel', 'icon', None),
+    ('Title.TLabel', 'title', None),
+    ('Subtitle.TLabel', 'subtitle', 'gray'),
+    ('H1.TLabel', 'h1', None),
+    ('H2.TLabel', 'h2', None),
+    ('Small.TLabel', 'small', None),
+    ('SEC.H2.TLabel', 'h2', 'green'),
+    ('Yahoo.H2.TLabel', 'h2', 'blue'),
+)
+
+
+def _create_fonts(root):
+    """Create the shared named fonts and resolve their metrics up front"""
+    for name, spec in _FONT_SPECS.items():
+        font = tkfont.Font(root=root, font=spec)
+        font.metrics()
+        _FONTS[name] = font
+
+
+def _configure_label_styles(style):
+    """Register the shared label styles so labels pick fonts by style name"""
+    style.configure('TLabel', font=_FONTS['body'])
+    for style_name, font_name, foreground in _LABEL_STYLES:
+        options = {'font': _FONTS[font_name]}
+        if foreground:
+            options['foreground'] = foreground
+        style.configure(style_name, **options)
+
+
+# Canvas currently under the pointer; the single <MouseWheel> handler scrolls it
+_active_scroll_target = [None]
+_mousewheel_dispatcher_installed = [False]
+# Wheel delta accumulated since the last scroll, and whether a flush is scheduled
+_pending_wheel_delta = [0]
+_wheel_flush_scheduled = [False]
+
+
+def _install_mousewheel_dispatcher(widget):
+    """Install the one global <MouseWheel> binding (first call only)"""
+    if _mousewheel_dispatcher_installed[0]:
+        return
+    
+    def _flush_wheel():
+        delta = _pending_wheel_delta[0]
+        _pending_wheel_delta[0] = 0
+        _wheel_flush_scheduled[0] = False
+        canvas = _active_scroll_target[0]
+        if canvas is not None and canvas.winfo_exists():
+            canvas.yview_scroll(int(-1*(delta/120)), "units")
+    
+    def _on_mousewheel(event):
+        # Coalesce a burst of wheel ticks into one scroll per WHEEL_THROTTLE_MS
+        _pending_wheel_delta[0] += event.delta
+        if not _wheel_flush_scheduled[0]:
+            _wheel_flush_scheduled[0] = True
+            widget.after(WHEEL_THROTTLE_MS, _flush_wheel)
+    
+    widget.bind_all("<MouseWheel>", _on_mousewheel)
+    _mousewheel_dispatcher_installed[0] = True
+
+
+def _set_readonly_text(text_widget, content):
+    """Replace a Text widget's content with one insert (one reflow), then make it read-only"""
+    text_widget.configure(state=tk.NORMAL)
+    text_widget.delete('1.0', tk.END)
+    text_widget.insert(tk.END, content)
+    text_widget.configure(state=tk.DISABLED)
+
+
+def _static_text(parent, content, font='body', width=85):
+    """Read-only tk.Text sized to show all of content (wrapped at width chars) without scrolling"""
+    height = sum(max(1, -(-len(line) // width)) for line in content.splitlines())
+    text = tk.Text(parent, wrap=tk.WORD, width=width, height=height, font=_FONTS[font],
+                   borderwidth=0, highlightthickness=0, relief=tk.FLAT, cursor='arrow')
+    # Blend in with the surrounding ttk frame
+    background = ttk.Style().lookup('TFrame', 'background')
+    if background:
+        text.configure(background=background)
+    _set_readonly_text(text, content)
+    return text
 
 
 class ScrollableFrame(ttk.Frame):
@@ -51,18 +245,27 @@ class ScrollableFrame(ttk.Frame):
         self.bind_mousewheel()
     
     def bind_mousewheel(self):
-        """Bind mousewheel events for scrolling"""
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_to_mousewheel(event):
-            self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        """Route mousewheel events to this canvas while the pointer is over it"""
+        _install_mousewheel_dispatcher(self.canvas)
         
-        def _unbind_from_mousewheel(event):
-            self.canvas.unbind_all("<MouseWheel>")
+        def _set_target(event):
+            _active_scroll_target[0] = self.canvas
         
-        self.canvas.bind('<Enter>', _bind_to_mousewheel)
-        self.canvas.bind('<Leave>', _unbind_from_mousewheel)
+        def _clear_target(event):
+            # <Leave> also fires when moving onto a child widget - keep the target then
+            try:
+                widget = self.canvas.winfo_containing(event.x_root, event.y_root)
+            except KeyError:
+                # Tk-internal widgets (e.g. the ttk combobox popdown) have no Python wrapper
+                widget = None
+            canvas_path = str(self.canvas)
+            if widget is not None and (str(widget) == canvas_path or str(widget).startswith(canvas_path + '.')):
+                return
+            if _active_scroll_target[0] is self.canvas:
+                _active_scroll_target[0] = None
+        
+        self.canvas.bind('<Enter>', _set_target)
+        self.canvas.bind('<Leave>', _clear_target)
 
 
 class EnhancedFinancialExtractor:
@@ -72,32 +275,19 @@ class EnhancedFinancialExtractor:
         self.outer_root.geometry("1200x800")
         self.outer_root.configure(bg='#f0f0f0')
 
-        # Create canvas and scrollbar
-        canvas = tk.Canvas(self.outer_root, borderwidth=0, background="#f0f0f0")
-        scrollbar = tk.Scrollbar(self.outer_root, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-
-        # Create internal frame and bind it to the canvas
-        internal_frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=internal_frame, anchor="nw")
-
-        def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-
-        internal_frame.bind("<Configure>", on_frame_configure)
-
-        # Optional: enable mousewheel scrolling
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        # Scrollable container; mousewheel is only bound while the pointer is over it
+        container = ScrollableFrame(self.outer_root)
+        container.canvas.configure(borderwidth=0, background="#f0f0f0")
+        container.pack(fill="both", expand=True)
 
         # Use internal frame for layout from now on
-        self.root = internal_frame
+        self.root = container.scrollable_frame
         
-        # Initialize data source modules
-        self.sec_finder = FinancialReportFinder()
-        self.yf_extractor = DataCenterExtractor()
+        # Data source modules are imported and created on first use (see properties below)
+        self._session = create_session(pool_size=SESSION_POOL_SIZE)
+        self._sec_finder = None
+        self._yf_extractor = None
+        self._finders_lock = threading.Lock()
         
         # Data storage
         self.selected_company = None
@@ -106,8 +296,61 @@ class EnhancedFinancialExtractor:
         self.preview_data = {}
         self.selected_files = set()
         
+        # In-process memoization of Yahoo lookups (keyed on query / ticker)
+        self._yf_search_cache = {}
+        self._yf_periods_cache = {}
+        
+        # SEC report URLs per filing, keyed on (cik, accession)
+        self._report_urls_cache = {}
+        
+        # Single bounded pool for all blocking network lookups
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="net")
+        
+        # Download / ZIP workers, kept for the app's lifetime (threads start on first use)
+        self._download_pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="download")
+        
+        # Background SEC submissions DataFrame fetches (all form types), keyed on CIK
+        self._submissions_cache = {}
+        
+        # Number of operations currently showing the progress bar
+        self._inflight = 0
 
-        self.setup_ui()
+        # Keep the window hidden while widgets are gridded so Tk lays it out once
+        self.outer_root.withdraw()
+        try:
+            self.setup_ui()
+        finally:
+            self.outer_root.deiconify()
+        
+    @property
+    def sec_finder(self):
+        """SEC data source, created on first use"""
+        with self._finders_lock:
+            if self._sec_finder is None:
+                from sec_finder import FinancialReportFinder
+                finder = FinancialReportFinder(session=self._session)
+                
+                # Serve repeated lookups from the on-disk cache instead of the network
+                finder.get_company_cik = cached(TICKER_CACHE_TTL)(finder.get_company_cik)
+                finder.get_company_info_from_cik = cached(TICKER_CACHE_TTL)(finder.get_company_info_from_cik)
+                # get_recent_submissions keeps its own ETag / If-Modified-Since cache, so
+                # every call cheaply revalidates instead of serving a day-old index
+                self._sec_finder = finder
+            return self._sec_finder
+        
+    @property
+    def yf_extractor(self):
+        """Yahoo Finance data source, created on first use"""
+        with self._finders_lock:
+            if self._yf_extractor is None:
+                from yf_finder import DataCenterExtractor
+                extractor = DataCenterExtractor()
+                
+                # Serve repeated lookups from the on-disk cache instead of the network
+                extractor.search_company = cached(TICKER_CACHE_TTL)(extractor.search_company)
+                extractor.get_available_periods = cached(FILINGS_CACHE_TTL)(extractor.get_available_periods)
+                self._yf_extractor = extractor
+            return self._yf_extractor
         
     def setup_ui(self):
         """Setup the main user interface"""
@@ -122,7 +365,7 @@ class EnhancedFinancialExtractor:
         
         # Title
         title_label = ttk.Label(main_frame, text="Enhanced Financial Data Extractor", 
-                               font=('Arial', 16, 'bold'))
+                               style='H1.TLabel')
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
         # Step 1: Data Source Selection
@@ -131,17 +374,15 @@ class EnhancedFinancialExtractor:
         # Step 2: Company Search
         self.create_company_search_section(main_frame, 2)
         
-        # Step 3: Form Type Selection
-        self.create_form_type_section(main_frame, 3)
-        
-        # Step 4: Time Period Selection
-        self.create_time_period_section(main_frame, 4)
-        
-        # Step 5: File Preview and Selection
-        self.create_file_preview_section(main_frame, 5)
-        
-        # Step 6: Download Options
-        self.create_download_section(main_frame, 6)
+        # Steps 3-6 start hidden, so only build them once the user gets there
+        self._main_frame = main_frame
+        self._section_builders = {
+            3: self.create_form_type_section,      # Step 3: Form Type Selection
+            4: self.create_time_period_section,    # Step 4: Time Period Selection
+            5: self.create_file_preview_section,   # Step 5: File Preview and Selection
+            6: self.create_download_section,       # Step 6: Download Options
+        }
+        self._built_sections = set()
         
         # Progress bar
         self.progress_var = tk.StringVar(value="Ready")
@@ -151,6 +392,13 @@ class EnhancedFinancialExtractor:
         self.progress_bar = ttk.Progressbar(main_frame, mode='indeterminate')
         self.progress_bar.grid(row=8, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
         
+    def _ensure_section(self, row):
+        """Build the (hidden) section for the given step row on first use"""
+        if row in self._built_sections:
+            return
+        self._section_builders[row](self._main_frame, row)
+        self._built_sections.add(row)
+        
     def create_data_source_section(self, parent, row):
         """Create data source selection section"""
         frame = ttk.LabelFrame(parent, text="Step 1: Select Data Source", padding="10")
@@ -205,6 +453,7 @@ class EnhancedFinancialExtractor:
         
         self.form_type_var = tk.StringVar()
         self.form_combo = ttk.Combobox(self.form_frame, textvariable=self.form_type_var, 
+                                      values=self._form_type_options(),
                                       state="readonly", width=40)
         self.form_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 0))
         self.form_combo.bind('<<ComboboxSelected>>', self.on_form_type_change)
@@ -310,13 +559,25 @@ class EnhancedFinancialExtractor:
                        variable=self.storage_var, value="zip",
                        command=self.on_storage_change).grid(row=0, column=1, sticky=tk.W, padx=(20, 0))
         
+        # Deflate level 1 is several times faster and only slightly larger on CSV/HTML
+        self.zip_fast_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(storage_frame, text="Fast ZIP compression",
+                       variable=self.zip_fast_var).grid(row=0, column=2, sticky=tk.W, padx=(20, 0))
+        
+        # Yahoo Finance tables can also be written as Feather / Parquet (needs pyarrow)
+        ttk.Label(storage_frame, text="Yahoo output format:").grid(row=0, column=3, sticky=tk.W, padx=(20, 0))
+        self.output_format_var = tk.StringVar(value="csv")
+        ttk.Combobox(storage_frame, textvariable=self.output_format_var,
+                    values=("csv", "feather", "parquet"), state="readonly",
+                    width=8).grid(row=0, column=4, sticky=tk.W, padx=(5, 0))
+        
         # Local path selection
         self.local_frame = ttk.Frame(self.download_frame)
         self.local_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
         
         ttk.Label(self.local_frame, text="Local Path:").grid(row=0, column=0, sticky=tk.W)
         
-        self.local_path_var = tk.StringVar(value=str(Path.home() / "Downloads" / "FinancialData"))
+        self.local_path_var = tk.StringVar(value=_DEFAULT_DOWNLOAD_PATH)
         self.local_path_entry = ttk.Entry(self.local_frame, textvariable=self.local_path_var, width=50)
         self.local_path_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 0))
         
@@ -336,19 +597,13 @@ class EnhancedFinancialExtractor:
         self.reset_form()
         
         # Update form type options based on data source
-        if self.data_source_var.get() == "sec":
-            form_types = [
-                "10-Q (Quarterly Reports)",
-                "10-K (Annual Reports)", 
-                "8-K (Current Reports)"
-            ]
-        else:  # yahoo
-            form_types = [
-                "Annual (Yearly Financial Statements)",
-                "Quarterly (Quarterly Financial Statements)"
-            ]
+        if 3 in self._built_sections:
+            self.form_type_var.set("")
+            self.form_combo['values'] = self._form_type_options()
         
-        self.form_combo['values'] = form_types
+    def _form_type_options(self):
+        """Form type options for the selected data source"""
+        return _SEC_FORM_TYPES if self.data_source_var.get() == "sec" else _YF_FORM_TYPES
         
     def reset_form(self):
         """Reset form to initial state"""
@@ -357,18 +612,21 @@ class EnhancedFinancialExtractor:
         self.selected_periods = []
         self.preview_data = {}
         self.selected_files = set()
+        self._submissions_cache = {}
+        self._report_urls_cache = {}
         
-        # Hide sections
-        self.form_frame.grid_remove()
-        self.period_frame.grid_remove()
-        self.preview_frame.grid_remove()
-        self.download_frame.grid_remove()
-        
-        # Clear widgets
+        # Hide sections and clear widgets (only those built so far)
         self.company_info_label.config(text="")
-        self.period_listbox.delete(0, tk.END)
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        if 3 in self._built_sections:
+            self.form_frame.grid_remove()
+        if 4 in self._built_sections:
+            self.period_frame.grid_remove()
+            self.period_listbox.delete(0, tk.END)
+        if 5 in self._built_sections:
+            self.preview_frame.grid_remove()
+            self.file_tree.delete(*self.file_tree.get_children())
+        if 6 in self._built_sections:
+            self.download_frame.grid_remove()
         
     def search_company(self):
         """Search for company using selected data source"""
@@ -377,54 +635,91 @@ class EnhancedFinancialExtractor:
             messagebox.showerror("Error", "Please enter a company ticker or name")
             return
         
-        self.progress_var.set("Searching for company...")
-        self.progress_bar.start()
+        self.start_progress("Searching for company...")
         
-        def search_thread():
-            try:
-                if self.data_source_var.get() == "sec":
-                    # Use SEC finder
-                    cik = self.sec_finder.get_company_cik(company_input)
-                    if cik:
-                        # For SEC, we'll store the CIK and company input
-                        
-                        company_info = self.sec_finder.get_company_info_from_cik(cik)
-                        self.selected_company = {
-                            'cik': cik,
-                            'ticker': company_info['ticker'],
-                            'name': company_info['title'],
-                            'source': 'sec'
-                        }
-                        success_msg = f"Found company: {company_info['title']} ({company_info['ticker']}) (CIK: {cik})"
-                    else:
-                        self.selected_company = None
-                        success_msg = None
-                else:
-                    # Use Yahoo Finance
-                    company_info = self.yf_extractor.search_company(company_input)
-                    if company_info:
-                        company_info['source'] = 'yahoo'
-                        self.selected_company = company_info
-                        success_msg = f"Found: {company_info['name']} ({company_info['ticker']})\nSector: {company_info['sector']}"
-                    else:
-                        self.selected_company = None
-                        success_msg = None
-                
-                # Update UI in main thread
-                self.root.after(0, self.update_company_search_result, success_msg)
-                
-            except Exception as e:
-                self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Search failed: {str(e)}"))
-
-            finally:
-                self.root.after(0, self.stop_progress)
+        # Read Tk state here - worker threads must not touch Tcl
+        source = self.data_source_var.get()
+        future = self._executor.submit(self._search_company_job, source, company_input)
+        future.add_done_callback(lambda f: self.root.after(0, self._handle_search_result, f))
+        
+    def _search_company_job(self, source, company_input):
+        """Look up the company on a worker thread; returns (company, success_msg)"""
+        if source == "sec":
+            # Use SEC finder
+            cik = self.sec_finder.get_company_cik(company_input)
+            if not cik:
+                return None, None
+            
+            # For SEC, we'll store the CIK and company input
+            company_info = self.sec_finder.get_company_info_from_cik(cik)
+            company = {
+                'cik': cik,
+                'ticker': company_info['ticker'],
+                'name': company_info['title'],
+                'source': 'sec'
+            }
+            return company, f"Found company: {company_info['title']} ({company_info['ticker']}) (CIK: {cik})"
+        
+        # Use Yahoo Finance
+        company_info = self._cached_yf_search(company_input)
+        if not company_info:
+            return None, None
         
-        threading.Thread(target=search_thread, daemon=True).start()
+        company_info['source'] = 'yahoo'
+        return company_info, f"Found: {company_info['name']} ({company_info['ticker']})\nSector: {company_info['sector']}"
+        
+    def _handle_search_result(self, future):
+        """Apply a finished company search on the UI thread"""
+        self.stop_progress()
+        try:
+            company, success_msg = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Search failed: {str(e)}")
+            return
+        
+        if company != self.selected_company:
+            self._report_urls_cache = {}
+        self.selected_company = company
+        self.update_company_search_result(success_msg)
+        
+        # Fetch the filings index while the user is still picking a form type
+        if company and company['source'] == 'sec':
+            self._prefetch_submissions(company['cik'])
+        
+    def _cached_yf_search(self, query):
+        """Yahoo company search memoized for the lifetime of the app"""
+        company_info = self._yf_search_cache.get(query)
+        if company_info is None:
+            company_info = self.yf_extractor.search_company(query)
+            if not company_info:
+                return company_info
+            company_info = self._yf_search_cache.setdefault(query, company_info)
+        # Hand out copies so callers can't mutate the cached entry
+        return dict(company_info)
+        
+    def _cached_yf_periods(self, ticker):
+        """Yahoo available periods memoized for the lifetime of the app"""
+        if ticker in self._yf_periods_cache:
+            return self._yf_periods_cache[ticker]
+        periods = self.yf_extractor.get_available_periods(ticker)
+        if periods:
+            return self._yf_periods_cache.setdefault(ticker, periods)
+        return periods
+        
+    def _report_urls(self, cik, accession):
+        """SEC report URLs for a filing, memoized per (cik, accession)"""
+        key = (cik, accession)
+        urls = self._report_urls_cache.get(key)
+        if urls is None:
+            urls = self._report_urls_cache.setdefault(
+                key, self.sec_finder.generate_financial_report_urls(cik, accession))
+        return urls
         
     def update_company_search_result(self, success_msg):
         """Update UI with company search results"""
         if success_msg:
             self.company_info_label.config(text=success_msg)
+            self._ensure_section(3)
             self.form_frame.grid()
         else:
             messagebox.showerror("Error", "Company not found")
@@ -432,74 +727,106 @@ class EnhancedFinancialExtractor:
     def on_form_type_change(self, event=None):
         """Handle form type selection change"""
         if self.selected_company:
+            self._ensure_section(4)
             self.period_frame.grid()
             
+            # Start fetching filings while the user is still picking periods
+            if self.selected_company['source'] == 'sec':
+                self._prefetch_submissions(self.selected_company['cik'])
+            
+    def _prefetch_submissions(self, cik):
+        """Return a future for the submissions DataFrame of cik, starting it if needed"""
+        future = self._submissions_cache.get(cik)
+        if future is None:
+            future = self._executor.submit(self.sec_finder.get_submissions_df, cik)
+            self._submissions_cache[cik] = future
+        return future
+            
     def load_time_periods(self):
         """Load available time periods for selected company and form type"""
         if not self.selected_company or not self.form_type_var.get():
             messagebox.showerror("Error", "Please select company and form type first")
             return
         
-        self.progress_var.set("Loading available periods...")
-        self.progress_bar.start()
+        self.start_progress("Loading available periods...")
+        
+        # Snapshot inputs on the UI thread, and queue the submissions fetch
+        # ahead of the job that waits on it
+        company = dict(self.selected_company)
+        form_type = self.form_type_var.get()
+        submissions_future = None
+        if company['source'] == 'sec':
+            form_type = _FORM_CODE[form_type]  # Form code (10-Q, 10-K, etc.)
+            submissions_future = self._prefetch_submissions(company['cik'])
+        
+        future = self._executor.submit(self._load_periods_job, company, form_type, submissions_future)
+        future.add_done_callback(lambda f: self.root.after(0, self._handle_periods_result, f))
+        
+    def _load_periods_job(self, company, form_type, submissions_future):
+        """Build the list of selectable periods on a worker thread"""
+        if company['source'] == 'sec':
+            # Get SEC filings - one submissions fetch serves every form type
+            sub_df = submissions_future.result()
+            if sub_df.empty:
+                # Don't keep a failed fetch around - retry on the next click
+                self._submissions_cache.pop(company['cik'], None)
+            filings = self.sec_finder.filter_filings(sub_df, form_type, count=10)
+            
+            return [
+                {
+                    'description': f"{filing['form']} - Filing: {filing['filingDate']} | Report: {filing['reportDate']}",
+                    'filing_date': filing['filingDate'],
+                    'report_date': filing['reportDate'],
+                    'accession': filing['accessionNumber'],
+                    'form': filing['form']
+                }
+                for filing in filings
+            ]
         
-        def load_periods_thread():
-            try:
-                periods = []
-                
-                if self.selected_company['source'] == 'sec':
-                    # Get SEC filings
-                    form_type = self.form_type_var.get().split()[0]  # Extract form type (10-Q, 10-K, etc.)
-                    filings = self.sec_finder.get_recent_filings(self.selected_company['cik'], form_type, count=10)
-                    
-                    for filing in filings:
-                        periods.append({
-                            'description': f"{filing['form']} - Filing: {filing['filingDate']} | Report: {filing['reportDate']}",
-                            'filing_date': filing['filingDate'],
-                            'report_date': filing['reportDate'],
-                            'accession': filing['accessionNumber'],
-                            'form': filing['form']
-                        })
-                        
-                else:
-                    # Get Yahoo Finance periods
-                    ticker = self.selected_company['ticker']
-                    yf_periods = self.yf_extractor.get_available_periods(ticker)
-                    
-                    if 'Quarterly' in self.form_type_var.get():
-                        # Generate quarterly periods
-                        for year in yf_periods.get('years', [])[:5]:  # Last 5 years
-                            for quarter in [1, 2, 3, 4]:
-                                periods.append({
-                                    'description': f"Q{quarter} {year}",
-                                    'year': year,
-                                    'quarter': quarter,
-                                    'period_type': 'quarterly'
-                                })
-                    else:
-                        # Generate annual periods
-                        for year in yf_periods.get('years', [])[:10]:  # Last 10 years
-                            periods.append({
-                                'description': f"Annual {year}",
-                                'year': year,
-                                'period_type': 'annual'
-                            })
-                
-                self.available_periods = periods
-                self.root.after(0, self.update_period_list)
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load periods: {str(e)}"))
-            finally:
-                self.root.after(0, self.stop_progress)
+        # Get Yahoo Finance periods
+        ticker = company['ticker']
+        years = self._cached_yf_periods(ticker).get('years', [])
+        
+        if 'Quarterly' in form_type:
+            # Generate quarterly periods for the last 5 years
+            return [
+                {
+                    'description': f"Q{quarter} {year}",
+                    'year': year,
+                    'quarter': quarter,
+                    'period_type': 'quarterly'
+                }
+                for year, quarter in itertools.product(years[:5], (1, 2, 3, 4))
+            ]
+        
+        # Generate annual periods for the last 10 years
+        return [
+            {
+                'description': f"Annual {year}",
+                'year': year,
+                'period_type': 'annual'
+            }
+            for year in years[:10]
+        ]
+        
+    def _handle_periods_result(self, future):
+        """Apply loaded periods on the UI thread"""
+        self.stop_progress()
+        try:
+            self.available_periods = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load periods: {str(e)}")
+            return
         
-        threading.Thread(target=load_periods_thread, daemon=True).start()
+        self.update_period_list()
         
     def update_period_list(self):
         """Update the period listbox with available periods"""
         self.period_listbox.delete(0, tk.END)
-        for period in self.available_periods:
-            self.period_listbox.insert(tk.END, period['description'])
+        # Listbox.insert takes varargs - one Tcl call for the whole list
+        descriptions = tuple(period['description'] for period in self.available_periods)
+        if descriptions:
+            self.period_listbox.insert(tk.END, *descriptions)
         
     def select_all_periods(self):
         """Select all periods in the list"""
@@ -520,8 +847,9 @@ class EnhancedFinancialExtractor:
         self.selected_periods = [self.available_periods[i] for i in selected_indices]
         
         # Clear file tree
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self._ensure_section(5)
+        self._ensure_section(6)
+        self.file_tree.delete(*self.file_tree.get_children())
         
         # Add available file types based on data source
         if self.selected_company['source'] == 'sec':
@@ -542,17 +870,18 @@ class EnhancedFinancialExtractor:
             ]
         
         for file_type, filename, description in file_types:
-            item_id = self.file_tree.insert('', tk.END, text=filename, 
-                                          values=(file_type, description),
-                                          tags=('file',))
+            self.file_tree.insert('', tk.END, text=filename, 
+                                  values=(file_type, description),
+                                  tags=('file',))
         
         self.preview_frame.grid()
         self.download_frame.grid()
         
     def select_all_files(self):
         """Select all files in the tree"""
-        for item in self.file_tree.get_children():
-            self.file_tree.selection_add(item)
+        children = self.file_tree.get_children()
+        if children:
+            self.file_tree.selection_set(children)
         
     def preview_selected_file(self):
         """Enhanced preview with Excel sheet analysis for SEC files"""
@@ -563,8 +892,9 @@ class EnhancedFinancialExtractor:
         
         # For now, show a simple preview window
         item = selected_items[0]
-        file_name = self.file_tree.item(item, 'text')
-        file_type = self.file_tree.item(item, 'values')[0]
+        info = self.file_tree.item(item)
+        file_name = info['text']
+        file_type = info['values'][0]
         
         # Create enhanced preview window
         preview_window = tk.Toplevel(self.root)
@@ -591,27 +921,27 @@ class EnhancedFinancialExtractor:
         info_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Enhanced preview content
-        preview_text = f"📊 File Type: {file_type}\n"
-        preview_text += f"📁 File Name: {file_name}\n"
-        preview_text += f"📅 Selected Periods: {len(self.selected_periods)}\n"
-        preview_text += f"🏢 Company: {self.selected_company['name']} ({self.selected_company['ticker']})\n\n"
+        preview_parts = [f"📊 File Type: {file_type}\n"]
+        preview_parts.append(f"📁 File Name: {file_name}\n")
+        preview_parts.append(f"📅 Selected Periods: {len(self.selected_periods)}\n")
+        preview_parts.append(f"🏢 Company: {self.selected_company['name']} ({self.selected_company['ticker']})\n\n")
         
         if self.selected_company['source'] == 'sec':
-            preview_text += "🏛️ SEC Edgar Data Format:\n\n"
+            preview_parts.append("🏛️ SEC Edgar Data Format:\n\n")
             
             if 'Excel' in file_type:
-                preview_text += "📊 Excel Financial Report Features:\n"
-                preview_text += "• Multiple sheets with comprehensive financial data\n"
-                preview_text += "• Consolidated financial statements (auto-selected)\n"
-                preview_text += "• Income statement, balance sheet, cash flow\n"
-                preview_text += "• Notes and footnotes\n"
-                preview_text += "• Automatic CSV export of consolidated sheets\n\n"
+                preview_parts.append("📊 Excel Financial Report Features:\n")
+                preview_parts.append("• Multiple sheets with comprehensive financial data\n")
+                preview_parts.append("• Consolidated financial statements (auto-selected)\n")
+                preview_parts.append("• Income statement, balance sheet, cash flow\n")
+                preview_parts.append("• Notes and footnotes\n")
+                preview_parts.append("• Automatic CSV export of consolidated sheets\n\n")
                 
-                preview_text += "🔄 Automatic Processing:\n"
-                preview_text += "• Consolidated sheets are automatically selected\n"
-                preview_text += "• Main financial statements are exported as CSV\n"
-                preview_text += "• Original Excel file is preserved\n"
-                preview_text += "• Files organized by year in folder structure\n\n"
+                preview_parts.append("🔄 Automatic Processing:\n")
+                preview_parts.append("• Consolidated sheets are automatically selected\n")
+                preview_parts.append("• Main financial statements are exported as CSV\n")
+                preview_parts.append("• Original Excel file is preserved\n")
+                preview_parts.append("• Files organized by year in folder structure\n\n")
                 
                 # Add Excel-specific preview tab if we have sample data
                 if self.selected_periods:
@@ -625,74 +955,67 @@ class EnhancedFinancialExtractor:
                     excel_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
                     excel_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
                     
-                    excel_preview = "📊 Expected Excel Sheet Structure:\n\n"
-                    excel_preview += "🟢 Consolidated Statements (Auto-Selected):\n"
-                    excel_preview += "   • Consolidated Income Statement\n"
-                    excel_preview += "   • Consolidated Balance Sheet\n"
-                    excel_preview += "   • Consolidated Cash Flow\n\n"
+                    excel_parts = ["📊 Expected Excel Sheet Structure:\n\n"]
+                    excel_parts.append("🟢 Consolidated Statements (Auto-Selected):\n")
+                    excel_parts.append("   • Consolidated Income Statement\n")
+                    excel_parts.append("   • Consolidated Balance Sheet\n")
+                    excel_parts.append("   • Consolidated Cash Flow\n\n")
                     
-                    excel_preview += "📋 Other Typical Sheets:\n"
-                    excel_preview += "   • Cover Page\n"
-                    excel_preview += "   • Notes to Financial Statements\n"
-                    excel_preview += "   • Supplementary Information\n\n"
+                    excel_parts.append("📋 Other Typical Sheets:\n")
+                    excel_parts.append("   • Cover Page\n")
+                    excel_parts.append("   • Notes to Financial Statements\n")
+                    excel_parts.append("   • Supplementary Information\n\n")
                     
-                    excel_preview += "⚙️ Processing Notes:\n"
-                    excel_preview += "   • Consolidated sheets are automatically exported as CSV\n"
-                    excel_preview += "   • Each sheet becomes a separate CSV file\n"
-                    excel_preview += "   • Files are organized in year-based folders\n"
-                    excel_preview += "   • CSV files are named with ticker, sheet name, and date\n"
+                    excel_parts.append("⚙️ Processing Notes:\n")
+                    excel_parts.append("   • Consolidated sheets are automatically exported as CSV\n")
+                    excel_parts.append("   • Each sheet becomes a separate CSV file\n")
+                    excel_parts.append("   • Files are organized in year-based folders\n")
+                    excel_parts.append("   • CSV files are named with ticker, sheet name, and date\n")
                     
-                    excel_text.insert(tk.END, excel_preview)
-                    excel_text.configure(state=tk.DISABLED)
+                    _set_readonly_text(excel_text, "".join(excel_parts))
                 
             else:
-                preview_text += f"📄 {file_type} Features:\n"
-                preview_text += "• Formatted financial statements in HTML\n"
-                preview_text += "• Professional SEC formatting\n"
-                preview_text += "• Direct browser preview available\n"
-                preview_text += "• Copy data directly from tables\n\n"
+                preview_parts.append(f"📄 {file_type} Features:\n")
+                preview_parts.append("• Formatted financial statements in HTML\n")
+                preview_parts.append("• Professional SEC formatting\n")
+                preview_parts.append("• Direct browser preview available\n")
+                preview_parts.append("• Copy data directly from tables\n\n")
                 
         else:
-            preview_text += "📈 Yahoo Finance Data Format:\n\n"
-            preview_text += f"📊 {file_type} Features:\n"
-            preview_text += "• CSV files with time series data\n"
-            preview_text += "• Columns for different financial metrics\n"
-            preview_text += "• Quarterly/annual frequency based on selection\n"
-            preview_text += "• Easy import into Excel, Python, R\n"
-            preview_text += "• Organized by period type and year\n\n"
+            preview_parts.append("📈 Yahoo Finance Data Format:\n\n")
+            preview_parts.append(f"📊 {file_type} Features:\n")
+            preview_parts.append("• CSV files with time series data\n")
+            preview_parts.append("• Columns for different financial metrics\n")
+            preview_parts.append("• Quarterly/annual frequency based on selection\n")
+            preview_parts.append("• Easy import into Excel, Python, R\n")
+            preview_parts.append("• Organized by period type and year\n\n")
         
         # Add folder structure preview
-        preview_text += "📁 Folder Structure:\n"
+        preview_parts.append("📁 Folder Structure:\n")
+        ticker = self.selected_company['ticker']
+        preview_parts.append(f"   📂 {ticker}/\n")
+        shown_periods = self.selected_periods[:3]  # Show first 3 periods
         if self.selected_company['source'] == 'sec':
-            preview_text += f"   📂 {self.selected_company['ticker']}/\n"
-            for period in self.selected_periods[:3]:  # Show first 3 periods
-                year = period['report_date'][:4]
-                preview_text += f"   └── 📂 {period['form']}/\n"
-                preview_text += f"       └── 📂 {year}/\n"
-                preview_text += f"           ├── 📄 Financial_Report.xlsx\n"
-                preview_text += f"           └── 📄 *_Consolidated_*.csv\n"
+            preview_parts.append("".join(
+                _SEC_PERIOD_TMPL.format_map({'form': p['form'], 'year': p['report_date'][:4]})
+                for p in shown_periods
+            ))
         else:
-            preview_text += f"   📂 {self.selected_company['ticker']}/\n"
-            for period in self.selected_periods[:3]:  # Show first 3 periods
-                period_type = period['period_type'].upper()
-                year = str(period['year'])
-                preview_text += f"   └── 📂 {period_type}/\n"
-                preview_text += f"       └── 📂 {year}/\n"
-                preview_text += f"           ├── 📄 {self.selected_company['ticker']}-Income_Statement-*.csv\n"
-                preview_text += f"           ├── 📄 {self.selected_company['ticker']}-Balance_Sheet-*.csv\n"
-                preview_text += f"           └── 📄 {self.selected_company['ticker']}-Cash_Flow-*.csv\n"
+            preview_parts.append("".join(
+                _YF_PERIOD_TMPL.format_map({'period_type': p['period_type'].upper(), 'year': p['year'], 'ticker': ticker})
+                for p in shown_periods
+            ))
         
         if len(self.selected_periods) > 3:
-            preview_text += f"   └── ... and {len(self.selected_periods) - 3} more period folders\n"
+            preview_parts.append(f"   └── ... and {len(self.selected_periods) - 3} more period folders\n")
         
-        preview_text += "\n💡 Pro Tips:\n"
-        preview_text += "• Files are automatically organized by year for easy analysis\n"
-        preview_text += "• Excel files include automatic CSV export of key sheets\n"
-        preview_text += "• Use 'Open Folder' button after extraction to view results\n"
-        preview_text += "• ZIP downloads preserve the same folder structure\n"
+        preview_parts.append("\n💡 Pro Tips:\n")
+        preview_parts.append("• Files are automatically organized by year for easy analysis\n")
+        preview_parts.append("• Excel files include automatic CSV export of key sheets\n")
+        preview_parts.append("• Use 'Open Folder' button after extraction to view results\n")
+        preview_parts.append("• ZIP downloads preserve the same folder structure\n")
         
-        info_text.insert(tk.END, preview_text)
-        info_text.configure(state=tk.DISABLED)
+        _set_readonly_text(info_text, "".join(preview_parts))
         
         # Add advanced preview tab for specific data sources
         if self.selected_company['source'] == 'sec' and len(self.selected_periods) > 0:
@@ -708,49 +1031,18 @@ class EnhancedFinancialExtractor:
             
             # Generate URLs for preview
             period = self.selected_periods[0]  # Use first period for preview
-            urls = self.sec_finder.generate_financial_report_urls(
-                self.selected_company['cik'], 
-                period['accession']
-            )
-            
-            advanced_preview = f"🔗 SEC Edgar URLs for {period['description']}:\n\n"
+            urls = self._report_urls(self.selected_company['cik'], period['accession'])
             
-            url_mapping = {
-                'Excel Financial Report': '📊 Excel File',
-                'Income Statement (HTML)': '📄 Income Statement',
-                'Balance Sheet (HTML)': '📄 Balance Sheet',
-                'Cash Flow Statement (HTML)': '📄 Cash Flow',
-                'Stockholder Equity (HTML)': '📄 Stockholder Equity'
-            }
+            advanced_parts = [f"🔗 SEC Edgar URLs for {period['description']}:\n\n"]
             
             for url_key, url in urls.items():
-                icon = url_mapping.get(url_key, '📄')
-                advanced_preview += f"{icon}: {url_key}\n"
-                advanced_preview += f"   🔗 {url}\n\n"
-            
-            advanced_preview += "⚙️ Automatic Processing Details:\n\n"
-            advanced_preview += "🔄 Excel File Processing:\n"
-            advanced_preview += "1. Download Excel file from SEC EDGAR\n"
-            advanced_preview += "2. Analyze sheet structure automatically\n"
-            advanced_preview += "3. Identify consolidated financial statements\n"
-            advanced_preview += "4. Export consolidated sheets as individual CSV files\n"
-            advanced_preview += "5. Preserve original Excel file for reference\n\n"
-            
-            advanced_preview += "📊 Expected Sheet Categories:\n"
-            advanced_preview += "• Cover Page: Filing information and summary\n"
-            advanced_preview += "• Consolidated Income Statement: Revenue, expenses, profit\n"
-            advanced_preview += "• Consolidated Balance Sheet: Assets, liabilities, equity\n"
-            advanced_preview += "• Consolidated Cash Flow: Operating, investing, financing flows\n"
-            advanced_preview += "• Notes: Footnotes and additional disclosures\n\n"
+                icon = _SEC_URL_DISPLAY.get(url_key, '📄')
+                advanced_parts.append(f"{icon}: {url_key}\n")
+                advanced_parts.append(f"   🔗 {url}\n\n")
             
-            advanced_preview += "🎯 Auto-Selection Logic:\n"
-            advanced_preview += "• Sheets with 'consolidated' in name are automatically selected\n"
-            advanced_preview += "• If no consolidated sheets found, main financial statements are selected\n"
-            advanced_preview += "• Cover pages and notes are excluded from auto-selection\n"
-            advanced_preview += "• Maximum of 3-5 sheets are auto-exported to prevent clutter\n"
+            advanced_parts.append(_SEC_PROCESSING_DETAILS)
             
-            advanced_text.insert(tk.END, advanced_preview)
-            advanced_text.configure(state=tk.DISABLED)
+            _set_readonly_text(advanced_text, "".join(advanced_parts))
         
         # Close button
         button_frame = ttk.Frame(main_frame)
@@ -762,20 +1054,10 @@ class EnhancedFinancialExtractor:
         # Add direct link button for SEC HTML files
         if self.selected_company['source'] == 'sec' and 'Statement' in file_type and len(self.selected_periods) > 0:
             period = self.selected_periods[0]
-            urls = self.sec_finder.generate_financial_report_urls(
-                self.selected_company['cik'], 
-                period['accession']
-            )
+            urls = self._report_urls(self.selected_company['cik'], period['accession'])
             
             # Map file type to URL
-            url_mapping = {
-                'Income Statement': 'Income Statement (HTML)',
-                'Balance Sheet': 'Balance Sheet (HTML)',
-                'Cash Flow Statement': 'Cash Flow Statement (HTML)',
-                'Stockholder Equity': 'Stockholder Equity (HTML)'
-            }
-            
-            url_key = url_mapping.get(file_type)
+            url_key = _SEC_URL_KEY.get(file_type)
             if url_key and url_key in urls:
                 def open_html_preview():
                     webbrowser.open(urls[url_key])
@@ -805,48 +1087,49 @@ class EnhancedFinancialExtractor:
         print(f"   📥 Downloading {report_type}...")
         print(f"      └─ File: {filename}")
         
-        # Download the Excel file first
-        file_content = None
+        # Download the Excel file first, straight to disk
         success = False
+        bytes_written = 0
         
         if self.sec_finder.render_api:
             print(f"      └─ Using SEC API...")
             try:
+                SEC_RATE_LIMITER.acquire()
                 file_content = self.sec_finder.render_api.get_file(url, return_binary=True)
-                success = True
+                if file_content:
+                    with open(filepath, 'wb') as f:
+                        bytes_written = f.write(file_content)
+                    success = True
+                del file_content  # analysis below reads from disk
             except Exception as e:
                 print(f"❌ SEC API download failed: {e}")
         
         if not success:
             print(f"      └─ Using basic download...")
             try:
-                response = requests.get(url, headers=self.sec_finder.headers, timeout=30)
-                response.raise_for_status()
-                file_content = response.content
-                success = True
+                # Stream the body to the file instead of holding it all in memory
+                bytes_written = self.sec_finder._stream_to_file(url, filepath)
+                success = bytes_written > 0
             except Exception as e:
                 print(f"❌ Basic download failed: {e}")
         
-        if not success or not file_content:
+        if not success:
             print(f"      ❌ Download failed")
             return False
         
-        # Save the Excel file
-        with open(filepath, 'wb') as f:
-            f.write(file_content)
-        
-        file_size = os.path.getsize(filepath) / 1024  # Size in KB
+        file_size = bytes_written / 1024  # Size in KB
         print(f"      ✅ Downloaded successfully ({file_size:.1f} KB)")
         
         # Analyze Excel file and automatically export consolidated sheets
         if self.sec_finder.pandas_available:
             print(f"      🔍 Analyzing Excel file structure...")
-            sheet_info = self.sec_finder.analyze_excel_file(file_content)
+            # Only the sheet names are needed to pick sheets - skip parsing their cells
+            sheet_names = self.sec_finder.get_excel_sheet_names(filepath)
             
-            if sheet_info:
+            if sheet_names:
                 # Auto-select consolidated sheets (default behavior)
                 auto_selected = []
-                for sheet_name in sheet_info.keys():
+                for sheet_name in sheet_names:
                     if 'consolidated' in sheet_name.lower():
                         auto_selected.append(sheet_name)
                 
@@ -857,14 +1140,14 @@ class EnhancedFinancialExtractor:
                     
                     # Export auto-selected sheets to CSV
                     exported = self.sec_finder.export_excel_sheets_to_csv(
-                        file_content, auto_selected, download_dir, ticker, report_date
+                        filepath, auto_selected, download_dir, ticker, report_date
                     )
                     print(f"      📊 Auto-exported {exported} consolidated sheet(s) to CSV")
                 else:
                     print(f"      ⚠️  No consolidated sheets found for auto-selection")
                     # If no consolidated sheets, try to find main financial statement sheets
                     financial_sheets = []
-                    for sheet_name in sheet_info.keys():
+                    for sheet_name in sheet_names:
                         if any(term in sheet_name.lower() for term in ['income', 'balance', 'cash', 'statement']):
                             financial_sheets.append(sheet_name)
                     
@@ -874,7 +1157,7 @@ class EnhancedFinancialExtractor:
                             print(f"         └─ '{sheet}'")
                         
                         exported = self.sec_finder.export_excel_sheets_to_csv(
-                            file_content, financial_sheets[:3], download_dir, ticker, report_date
+                            filepath, financial_sheets[:3], download_dir, ticker, report_date
                         )
                         print(f"      📊 Auto-exported {exported} financial statement sheet(s) to CSV")
             else:
@@ -921,26 +1204,37 @@ class EnhancedFinancialExtractor:
             messagebox.showerror("Error", "Please specify local storage path")
             return
         
-        self.progress_var.set("Extracting data...")
-        self.progress_bar.start()
+        self.start_progress("Extracting data...")
+        
+        # Snapshot Tk state on the UI thread; the worker only sees plain values
+        storage = self.storage_var.get()
+        local_path = self.local_path_var.get()
+        compresslevel = ZIP_FAST_COMPRESSLEVEL if self.zip_fast_var.get() else ZIP_DEFAULT_COMPRESSLEVEL
+        output_format = self.output_format_var.get()
+        file_infos = [self.file_tree.item(item) for item in selected_files]
+        selected_files = [(info['text'], info['values'][0]) for info in file_infos]
         
         def extract_thread():
             try:
-                extracted_files = []
+                local_paths, pending = [], []
+                # One timestamp for every file (and the ZIP) written by this job
+                job_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+                pool = self._download_pool
                 
                 if self.selected_company['source'] == 'sec':
                     # Extract SEC data
-                    extracted_files = self.extract_sec_data(selected_files)
+                    local_paths, pending = self.extract_sec_data(selected_files, storage, local_path, pool)
                 else:
                     # Extract Yahoo Finance data
-                    extracted_files = self.extract_yahoo_data(selected_files)
+                    local_paths, pending = self.extract_yahoo_data(selected_files, storage, local_path, pool,
+                                                                   output_format, job_ts)
                 
                 # Handle storage
-                if self.storage_var.get() == "zip":
-                    zip_path = self.create_zip_file(extracted_files)
+                if storage == "zip":
+                    zip_path = self.create_zip_file(local_paths, pending, compresslevel, job_ts, pool)
                     self.root.after(0, lambda: self.show_extraction_success(f"ZIP file created: {zip_path}"))
                 else:
-                    self.root.after(0, lambda: self.show_extraction_success(f"Files saved to: {self.local_path_var.get()}"))
+                    self.root.after(0, lambda: self.show_extraction_success(f"Files saved to: {local_path}"))
                 
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Error", f"Extraction failed: {str(e)}"))
@@ -949,15 +1243,25 @@ class EnhancedFinancialExtractor:
         
         threading.Thread(target=extract_thread, daemon=True).start()
         
-    def extract_sec_data(self, selected_files):
-        """Extract SEC data for selected files and periods with enhanced folder structure"""
-        extracted_files = []
+    def extract_sec_data(self, selected_files, storage, local_path, pool):
+        """
+        Extract SEC data for selected files and periods with enhanced folder structure
+        
+        Returns:
+            tuple: (local_paths, pending) - files written to disk, and ZIP-bound
+                   records whose URLs are downloaded by create_zip_file
+        """
+        local_paths = []
+        pending = []
+        ticker = self.selected_company['ticker']
         
         # Create local directory if needed
-        if self.storage_var.get() == "local":
-            local_dir = Path(self.local_path_var.get())
+        if storage == "local":
+            local_dir = Path(local_path)
             local_dir.mkdir(parents=True, exist_ok=True)
         
+        # Collect one download job per (period, file), then run them concurrently
+        jobs = []
         for period in self.selected_periods:
             # Extract year from report date for folder structure
             try:
@@ -966,116 +1270,150 @@ class EnhancedFinancialExtractor:
                 period_year = "unknown"
             
             # Create organized folder structure: data/TICKER/FORM-TYPE/YEAR/
-            if self.storage_var.get() == "local":
-                download_dir = local_dir / self.selected_company['ticker'] / period['form'] / period_year
+            if storage == "local":
+                download_dir = local_dir / ticker / period['form'] / period_year
                 download_dir.mkdir(parents=True, exist_ok=True)
             
             # Generate URLs for this period
-            urls = self.sec_finder.generate_financial_report_urls(
-                self.selected_company['cik'], 
-                period['accession']
-            )
+            urls = self._report_urls(self.selected_company['cik'], period['accession'])
             
-            for file_item in selected_files:
-                file_name = self.file_tree.item(file_item, 'text')
-                file_type = self.file_tree.item(file_item, 'values')[0]
-                
-                # Map file type to URL
-                url_key = None
-                for key in urls:
-                    if file_type.lower() in key.lower():
-                        url_key = key
-                        break
+            lc_keys = None
+            for file_name, file_type in selected_files:
+                # Map file type to URL (precomputed table, substring match as fallback)
+                url_key = _SEC_URL_KEY.get(file_type)
+                if url_key is None:
+                    if lc_keys is None:
+                        lc_keys = [(key.lower(), key) for key in urls]
+                    ft = file_type.lower()
+                    url_key = next((key for lc, key in lc_keys if ft in lc), None)
                 
                 if url_key and url_key in urls:
-                    try:
-                        # Download file
-                        if self.storage_var.get() == "local":
-                            # Use enhanced download method with auto Excel sheet selection
-                            success = self.download_financial_report_enhanced(
-                                urls[url_key], download_dir, 
-                                period['filing_date'], period['report_date'], 
-                                file_type, self.selected_company['ticker']
-                            )
-                            
-                            if success:
-                                # Find the downloaded file(s) - could be multiple if Excel sheets were exported
-                                safe_filename = self.sec_finder.get_safe_filename(
-                                    urls[url_key], period['filing_date'], 
-                                    period['report_date'], file_type, 
-                                    self.selected_company['ticker']
-                                )
-                                file_path = download_dir / safe_filename
-                                extracted_files.append(str(file_path))
-                                
-                                # Also add any CSV files that were exported from Excel
-                                if 'Excel' in file_type:
-                                    csv_files = list(download_dir.glob(f"{self.selected_company['ticker']}-*-{period['report_date'].replace('-', '')}.csv"))
-                                    extracted_files.extend([str(f) for f in csv_files])
-                        else:
-                            # For ZIP download, we'll handle this differently
-                            # Store file info for later processing
-                            extracted_files.append({
-                                'url': urls[url_key],
-                                'filename': f"{self.selected_company['ticker']}-{file_type}-{period['report_date']}.{file_name.split('.')[-1]}",
-                                'period': period,
-                                'type': file_type,
-                                'year': period_year
-                            })
-                    except Exception as e:
-                        print(f"Failed to download {file_type} for {period['description']}: {e}")
+                    if storage == "local":
+                        jobs.append((urls[url_key], download_dir, period, file_type))
+                    else:
+                        # For ZIP download, we'll handle this differently
+                        # Store file info for later processing
+                        pending.append({
+                            'url': urls[url_key],
+                            'filename': f"{ticker}-{file_type}-{period['report_date']}.{file_name.split('.')[-1]}",
+                            'period': period,
+                            'type': file_type,
+                            'year': period_year
+                        })
         
-        return extracted_files
+        futures = {
+            pool.submit(self._download_sec_file, url, download_dir, period, file_type, ticker): (period, file_type)
+            for url, download_dir, period, file_type in jobs
+        }
+        for future in as_completed(futures):
+            period, file_type = futures[future]
+            try:
+                local_paths.extend(future.result())
+            except Exception as e:
+                print(f"Failed to download {file_type} for {period['description']}: {e}")
+        
+        return local_paths, pending
+    
+    def _download_sec_file(self, url, download_dir, period, file_type, ticker):
+        """Download one SEC report (worker thread); returns the local file paths written"""
+        # Use enhanced download method with auto Excel sheet selection
+        success = self.download_financial_report_enhanced(
+            url, download_dir, 
+            period['filing_date'], period['report_date'], 
+            file_type, ticker
+        )
+        if not success:
+            return []
+        
+        # Find the downloaded file(s) - could be multiple if Excel sheets were exported
+        safe_filename = self.sec_finder.get_safe_filename(
+            url, period['filing_date'], 
+            period['report_date'], file_type, 
+            ticker
+        )
+        file_paths = [str(download_dir / safe_filename)]
+        
+        # Also add any CSV files that were exported from Excel
+        if 'Excel' in file_type:
+            # One scandir pass with plain prefix/suffix checks instead of glob's fnmatch
+            prefix = f"{ticker}-"
+            suffix = f"-{period['report_date'].replace('-', '')}.csv"
+            with os.scandir(download_dir) as entries:
+                file_paths.extend(entry.path for entry in entries
+                                  if entry.name.startswith(prefix) and entry.name.endswith(suffix))
+        return file_paths
 
     
-    def extract_yahoo_data(self, selected_files):
-        """Extract Yahoo Finance data for selected files and periods with enhanced folder structure"""
-        extracted_files = []
+    def _yahoo_period_range(self, period):
+        """Return (start_date, end_date, period_suffix) for a Yahoo Finance period"""
+        year = period['year']
+        if period['period_type'] == 'quarterly':
+            # Calculate start and end dates for quarter
+            quarter = period['quarter']
+            start_month = (quarter - 1) * 3 + 1
+            end_month = quarter * 3
+            start_date = f"{year}-{start_month:02d}-01"
+            end_date = f"{year}-{end_month:02d}-{30 if end_month in [6, 9] else 31}"
+            return start_date, end_date, f"Q{quarter}_{year}"
+        
+        # Annual data
+        return f"{year}-01-01", f"{year}-12-31", f"Annual_{year}"
+    
+    def extract_yahoo_data(self, selected_files, storage, local_path, pool, output_format="csv", timestamp=None):
+        """
+        Extract Yahoo Finance data for selected files and periods with enhanced folder structure
+        
+        Returns:
+            tuple: (local_paths, pending) - files written to disk, and ZIP-bound
+                   records holding the data to serialize
+        """
+        from yf_finder import OUTPUT_EXTENSIONS, write_dataframe
+        
+        local_paths = []
+        pending = []
+        extension = OUTPUT_EXTENSIONS[output_format]
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ticker = self.selected_company['ticker']
         
         # Create local directory if needed
-        if self.storage_var.get() == "local":
-            local_dir = Path(self.local_path_var.get())
+        if storage == "local":
+            local_dir = Path(local_path)
             local_dir.mkdir(parents=True, exist_ok=True)
         
-        for period in self.selected_periods:
+        # Yahoo returns full statements and one price history per request, so fetch
+        # once per frequency covering all its periods and slice each period locally
+        ranges = [self._yahoo_period_range(period) for period in self.selected_periods]
+        spans = {}
+        for period, (start_date, end_date, _) in zip(self.selected_periods, ranges):
+            freq = 'quarterly' if period['period_type'] == 'quarterly' else 'annual'
+            earliest, latest = spans.get(freq, (start_date, end_date))
+            spans[freq] = (min(earliest, start_date), max(latest, end_date))
+        
+        futures = {}
+        for freq, (earliest, latest) in spans.items():
+            # history() treats end as exclusive - go one day past the last period
+            fetch_end = (datetime.strptime(latest, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+            futures[freq] = pool.submit(self.yf_extractor.get_company_data, ticker, earliest, fetch_end, freq)
+        
+        for period, (start_date, end_date, period_suffix) in zip(self.selected_periods, ranges):
             # Extract year for folder structure
             period_year = str(period['year'])
             period_type = period['period_type'].upper()  # QUARTERLY or ANNUAL
             
             # Create organized folder structure: data/TICKER/PERIOD_TYPE/YEAR/
-            if self.storage_var.get() == "local":
-                download_dir = local_dir / self.selected_company['ticker'] / period_type / period_year
+            if storage == "local":
+                download_dir = local_dir / ticker / period_type / period_year
                 download_dir.mkdir(parents=True, exist_ok=True)
             
-            # Get data for this period
-            if period['period_type'] == 'quarterly':
-                # Calculate start and end dates for quarter
-                year = period['year']
-                quarter = period['quarter']
-                start_month = (quarter - 1) * 3 + 1
-                end_month = quarter * 3
-                start_date = f"{year}-{start_month:02d}-01"
-                end_date = f"{year}-{end_month:02d}-{30 if end_month in [6, 9] else 31}"
-                period_suffix = f"Q{quarter}_{year}"
-            else:
-                # Annual data
-                start_date = f"{period['year']}-01-01"
-                end_date = f"{period['year']}-12-31"
-                period_suffix = f"Annual_{year}"
-            
-            # Get company data
-            company_data = self.yf_extractor.get_company_data(
-                self.selected_company['ticker'], 
-                start_date, end_date,
-                'quarterly' if period['period_type'] == 'quarterly' else 'annual'
-            )
+            # Get company data, with the price history narrowed to this period
+            freq = 'quarterly' if period['period_type'] == 'quarterly' else 'annual'
+            company_data = futures[freq].result()
+            if company_data and company_data.get('historical') is not None:
+                company_data = dict(company_data, historical=company_data['historical'].loc[start_date:end_date])
             
             if company_data:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                
-                for file_item in selected_files:
-                    file_name = self.file_tree.item(file_item, 'text')
-                    file_type = self.file_tree.item(file_item, 'values')[0]
+                for file_name, file_type in selected_files:
                     
                     # Map file type to data
                     data_to_save = None
@@ -1093,72 +1431,107 @@ class EnhancedFinancialExtractor:
                     
                     if data_to_save is not None and not data_to_save.empty:
                         # Enhanced filename with period information
-                        filename = f"{self.selected_company['ticker']}-{file_type.replace(' ', '_')}-{period_suffix}-{timestamp}.csv"
+                        filename = f"{ticker}-{file_type.replace(' ', '_')}-{period_suffix}-{timestamp}{extension}"
                         
-                        if self.storage_var.get() == "local":
+                        if storage == "local":
                             file_path = download_dir / filename
-                            data_to_save.to_csv(file_path)
-                            extracted_files.append(str(file_path))
+                            bytes_written = write_dataframe(data_to_save, file_path, output_format)
+                            local_paths.append(str(file_path))
                             
-                            file_size = os.path.getsize(file_path) / 1024  # Size in KB
+                            file_size = bytes_written / 1024  # Size in KB
                             print(f"   ✅ Saved {file_type} for {period_suffix} ({file_size:.1f} KB)")
                         else:
                             # For ZIP download
-                            extracted_files.append({
+                            pending.append({
                                 'data': data_to_save,
                                 'filename': filename,
                                 'period': period,
                                 'type': file_type,
                                 'year': period_year,
-                                'period_type': period_type
+                                'period_type': period_type,
+                                'format': output_format
                             })
         
-        return extracted_files
+        return local_paths, pending
+    
+    def _fetch_to_spool(self, url):
+        """Download url into a spooled temp file (worker thread); returns it rewound"""
+        spool = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_MEMORY)
+        try:
+            with self._session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True  # undo gzip transfer encoding
+                shutil.copyfileobj(response.raw, spool, length=ZIP_COPY_CHUNK_SIZE)
+        except Exception:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
     
-    def create_zip_file(self, extracted_files):
+    def _write_downloads_to_zip(self, zipf, downloads, pool):
+        """
+        Download (zip_name, url) pairs on pool and write them into zipf as they arrive
+        
+        Workers fetch concurrently into a bounded queue; this thread is the only
+        one writing to the ZipFile, which is not safe for concurrent writes.
+        """
+        ready = queue.Queue(maxsize=ZIP_QUEUE_SIZE)
+        
+        def produce(zip_name, url):
+            try:
+                ready.put((zip_name, self._fetch_to_spool(url), None))
+            except Exception as e:
+                ready.put((zip_name, None, e))
+        
+        for zip_name, url in downloads:
+            pool.submit(produce, zip_name, url)
+        
+        for _ in range(len(downloads)):
+            zip_name, spool, error = ready.get()
+            if error is not None:
+                print(f"Failed to add {zip_name} to ZIP: {error}")
+                continue
+            try:
+                with spool, zipf.open(zip_name, 'w', force_zip64=True) as entry:
+                    shutil.copyfileobj(spool, entry, length=ZIP_COPY_CHUNK_SIZE)
+            except Exception as e:
+                print(f"Failed to add {zip_name} to ZIP: {e}")
+    
+    def create_zip_file(self, local_paths, pending, compresslevel=ZIP_FAST_COMPRESSLEVEL, timestamp=None, pool=None):
         """Create ZIP file with extracted data using organized folder structure"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_filename = f"{self.selected_company['ticker']}_financial_data_{timestamp}.zip"
-        zip_path = Path.home() / "Downloads" / zip_filename
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        zip_path = _DOWNLOADS_DIR / zip_filename
+        
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=compresslevel, allowZip64=True) as zipf:
+            # Files already on disk - preserve folder structure in ZIP
+            for file_path in local_paths:
+                if os.path.exists(file_path):
+                    zipf.write(file_path, os.path.relpath(file_path, _DEFAULT_DOWNLOAD_PATH))
+            
+            ticker = self.selected_company['ticker']
             if self.selected_company['source'] == 'sec':
-                # Handle SEC files with organized folder structure
-                for file_info in extracted_files:
-                    if isinstance(file_info, dict):
-                        # Download and add to ZIP with folder structure
-                        try:
-                            response = requests.get(file_info['url'], 
-                                                headers=self.sec_finder.headers, 
-                                                timeout=30)
-                            response.raise_for_status()
-                            
-                            # Create organized path in ZIP: TICKER/FORM/YEAR/filename
-                            zip_path_in_archive = f"{self.selected_company['ticker']}/{file_info['period']['form']}/{file_info['year']}/{file_info['filename']}"
-                            zipf.writestr(zip_path_in_archive, response.content)
-                            
-                        except Exception as e:
-                            print(f"Failed to add {file_info['filename']} to ZIP: {e}")
-                    else:
-                        # Local file path
-                        if os.path.exists(file_info):
-                            # Preserve folder structure in ZIP
-                            rel_path = os.path.relpath(file_info, Path.home() / "Downloads" / "FinancialData")
-                            zipf.write(file_info, rel_path)
+                # Handle SEC files with organized folder structure: TICKER/FORM/YEAR/filename
+                downloads = [
+                    (f"{ticker}/{file_info['period']['form']}/{file_info['year']}/{file_info['filename']}", file_info['url'])
+                    for file_info in pending
+                ]
+                
+                # Download and add to ZIP with folder structure
+                if downloads:
+                    self._write_downloads_to_zip(zipf, downloads, pool or self._download_pool)
             else:
                 # Handle Yahoo Finance data with organized folder structure
-                for file_info in extracted_files:
-                    if isinstance(file_info, dict) and 'data' in file_info:
-                        csv_content = file_info['data'].to_csv()
-                        
-                        # Create organized path in ZIP: TICKER/PERIOD_TYPE/YEAR/filename
-                        zip_path_in_archive = f"{self.selected_company['ticker']}/{file_info['period_type']}/{file_info['year']}/{file_info['filename']}"
-                        zipf.writestr(zip_path_in_archive, csv_content)
-                        
-                    elif isinstance(file_info, str) and os.path.exists(file_info):
-                        # Preserve folder structure in ZIP
-                        rel_path = os.path.relpath(file_info, Path.home() / "Downloads" / "FinancialData")
-                        zipf.write(file_info, rel_path)
+                from yf_finder import dataframe_bytes
+                
+                for file_info in pending:
+                    content = dataframe_bytes(file_info['data'], file_info.get('format', 'csv'))
+                    
+                    # Create organized path in ZIP: TICKER/PERIOD_TYPE/YEAR/filename
+                    zip_path_in_archive = f"{ticker}/{file_info['period_type']}/{file_info['year']}/{file_info['filename']}"
+                    zipf.writestr(zip_path_in_archive, content)
         
         return str(zip_path)
     
@@ -1177,10 +1550,10 @@ class EnhancedFinancialExtractor:
         frame.pack(fill=tk.BOTH, expand=True)
         
         # Success icon and message
-        ttk.Label(frame, text="✅", font=('Arial', 24)).pack(pady=(0, 10))
+        ttk.Label(frame, text="✅", style='Icon.TLabel').pack(pady=(0, 10))
         ttk.Label(frame, text="Data extraction completed successfully!", 
-                 font=('Arial', 12, 'bold')).pack(pady=(0, 10))
-        ttk.Label(frame, text=message, font=('Arial', 10)).pack(pady=(0, 20))
+                 style='H2.TLabel').pack(pady=(0, 10))
+        ttk.Label(frame, text=message).pack(pady=(0, 20))
         
         # Buttons
         button_frame = ttk.Frame(frame)
@@ -1206,52 +1579,25 @@ class EnhancedFinancialExtractor:
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder: {e}")
     
+    def start_progress(self, message):
+        """Show status message and start progress bar (shared by overlapping operations)"""
+        self.progress_var.set(message)
+        self._inflight += 1
+        if self._inflight == 1:
+            # 200ms ticks instead of Tk's default 50ms - fewer redraws competing with input
+            self.progress_bar.start(PROGRESS_INTERVAL_MS)
+        
     def stop_progress(self):
-        """Stop progress bar and reset status"""
+        """Stop progress bar and reset status once no operation is running"""
+        self._inflight = max(self._inflight - 1, 0)
+        if self._inflight:
+            return
         self.progress_bar.stop()
         self.progress_var.set("Ready")
 
-class WelcomeWindow:
-    """Enhanced welcome screen with instructions"""
-    def __init__(self, root):
-        self.root = root
-        self.show_welcome()
-    
-    def show_welcome(self):
-        """Show welcome dialog with enhanced styling"""
-        welcome = tk.Toplevel(self.root)
-        welcome.title("Welcome to Enhanced Financial Data Extractor")
-        welcome.geometry("750x650")
-        welcome.resizable(False, False)
-        welcome.transient(self.root)
-        welcome.grab_set()
-        
-        # Center the window
-        welcome.update_idletasks()
-        x = (welcome.winfo_screenwidth() // 2) - (750 // 2)
-        y = (welcome.winfo_screenheight() // 2) - (650 // 2)
-        welcome.geometry(f"750x650+{x}+{y}")
-        
-        # Create scrollable frame for welcome content
-        welcome_scroll = ScrollableFrame(welcome)
-        welcome_scroll.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        frame = welcome_scroll.scrollable_frame
-        
-        # Title section
-        title_frame = ttk.Frame(frame)
-        title_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        ttk.Label(title_frame, text="🚀 Enhanced Financial Data Extractor", 
-                 font=('Arial', 18, 'bold')).pack()
-        ttk.Label(title_frame, text="Professional Financial Data Acquisition Tool", 
-                 font=('Arial', 12, 'italic'), foreground='gray').pack()
-        
-        # Features section
-        features_frame = ttk.LabelFrame(frame, text="✨ Key Features", padding="15")
-        features_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        features_text = """
+
+# Static welcome / documentation text, stripped once at import
+_FEATURES_TEXT = """
 🏢 Dual Data Sources:
    • SEC Edgar: Official regulatory filings (10-Q, 10-K, 8-K)
    • Yahoo Finance: Historical financial statements and market data
@@ -1271,17 +1617,9 @@ class WelcomeWindow:
    • Real-time progress tracking
    • Detailed error handling and validation
    • Professional styling and icons
-        """
-        
-        features_label = ttk.Label(features_frame, text=features_text.strip(), 
-                                 font=('Arial', 10), justify=tk.LEFT)
-        features_label.pack(anchor=tk.W)
-        
-        # How to use section
-        howto_frame = ttk.LabelFrame(frame, text="📋 How to Use", padding="15")
-        howto_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        howto_text = """
+""".strip()
+
+_HOWTO_TEXT = """
 1. 📊 Select Data Source: Choose between SEC Edgar or Yahoo Finance
 2. 🔍 Search Company: Enter ticker symbol or company name
 3. 📋 Choose Form Type: Select the type of financial report you need
@@ -1289,28 +1627,9 @@ class WelcomeWindow:
 5. 📁 Preview Files: Review available files and select what you need
 6. 💾 Configure Download: Choose local storage or ZIP download
 7. 🚀 Extract Data: Start the download process and track progress
-        """
-        
-        howto_label = ttk.Label(howto_frame, text=howto_text.strip(), 
-                               font=('Arial', 10), justify=tk.LEFT)
-        howto_label.pack(anchor=tk.W)
-        
-        # Data sources comparison
-        sources_frame = ttk.LabelFrame(frame, text="📊 Data Sources Comparison", padding="15")
-        sources_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        # Create two columns for comparison
-        comparison_frame = ttk.Frame(sources_frame)
-        comparison_frame.pack(fill=tk.X)
-        
-        # SEC Edgar column
-        sec_frame = ttk.Frame(comparison_frame)
-        sec_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        ttk.Label(sec_frame, text="🏛️ SEC Edgar", font=('Arial', 12, 'bold'), 
-                 foreground='green').pack()
-        
-        sec_details = """
+""".strip()
+
+_SEC_DETAILS = """
 ✅ Official regulatory filings
 ✅ Most accurate and comprehensive
 ✅ Excel and HTML formats
@@ -1318,19 +1637,9 @@ class WelcomeWindow:
 ✅ Current and historical data
 ⚠️  Requires internet connection
 ⚠️  May have download delays
-        """
-        
-        ttk.Label(sec_frame, text=sec_details.strip(), font=('Arial', 9), 
-                 justify=tk.LEFT).pack(anchor=tk.W)
-        
-        # Yahoo Finance column
-        yahoo_frame = ttk.Frame(comparison_frame)
-        yahoo_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(10, 0))
-        
-        ttk.Label(yahoo_frame, text="📈 Yahoo Finance", font=('Arial', 12, 'bold'), 
-                 foreground='blue').pack()
-        
-        yahoo_details = """
+""".strip()
+
+_YAHOO_DETAILS = """
 ✅ Fast and reliable access
 ✅ Easy-to-use CSV format
 ✅ Historical market data
@@ -1338,16 +1647,9 @@ class WelcomeWindow:
 ✅ Good for analysis/modeling
 ⚠️  Aggregated data
 ⚠️  May have slight delays
-        """
-        
-        ttk.Label(yahoo_frame, text=yahoo_details.strip(), font=('Arial', 9), 
-                 justify=tk.LEFT).pack(anchor=tk.W)
-        
-        # Tips section
-        tips_frame = ttk.LabelFrame(frame, text="💡 Pro Tips", padding="15")
-        tips_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        tips_text = """
+""".strip()
+
+_TIPS_TEXT = """
 🎯 For Academic Research: Use SEC Edgar for official, audited data
 📊 For Quick Analysis: Use Yahoo Finance for rapid data acquisition
 🔄 Multi-Period Analysis: Select multiple quarters/years for trend analysis
@@ -1355,69 +1657,17 @@ class WelcomeWindow:
 💾 Large Downloads: Use ZIP format for multiple companies/periods
 🔍 Preview First: Always preview files to understand data structure
 ⚡ Scroll Interface: Use scroll buttons or mouse wheel to navigate
-        """
-        
-        tips_label = ttk.Label(tips_frame, text=tips_text.strip(), 
-                              font=('Arial', 10), justify=tk.LEFT)
-        tips_label.pack(anchor=tk.W)
-        
-        # Example companies section
-        examples_frame = ttk.LabelFrame(frame, text="🏢 Example Companies", padding="15")
-        examples_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        examples_text = """
+""".strip()
+
+_EXAMPLES_TEXT = """
 Technology: AAPL (Apple), MSFT (Microsoft), GOOGL (Google), NVDA (NVIDIA)
 Finance: JPM (JPMorgan), BAC (Bank of America), V (Visa), MA (Mastercard)
 Healthcare: JNJ (Johnson & Johnson), PFE (Pfizer), UNH (UnitedHealth)
 Energy: XOM (ExxonMobil), CVX (Chevron), COP (ConocoPhillips)
 Consumer: AMZN (Amazon), TSLA (Tesla), WMT (Walmart), KO (Coca-Cola)
-        """
-        
-        examples_label = ttk.Label(examples_frame, text=examples_text.strip(), 
-                                  font=('Arial', 10), justify=tk.LEFT)
-        examples_label.pack(anchor=tk.W)
-        
-        # Button frame
-        button_frame = ttk.Frame(frame)
-        button_frame.pack(pady=(20, 0))
-        
-        ttk.Button(button_frame, text="🚀 Get Started", 
-                  command=welcome.destroy).pack(side=tk.LEFT, padx=(0, 15))
-        ttk.Button(button_frame, text="📚 Documentation", 
-                  command=lambda: self.show_documentation(welcome)).pack(side=tk.LEFT, padx=(0, 15))
-        ttk.Button(button_frame, text="❌ Exit", 
-                  command=self.root.quit).pack(side=tk.LEFT)
-    
-    def show_documentation(self, parent_window):
-        """Show comprehensive documentation window"""
-        doc_window = tk.Toplevel(parent_window)
-        doc_window.title("📚 Documentation & Help")
-        doc_window.geometry("900x700")
-        doc_window.resizable(True, True)
-        
-        # Create scrollable documentation
-        doc_scroll = ScrollableFrame(doc_window)
-        doc_scroll.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        frame = doc_scroll.scrollable_frame
-        
-        # Create notebook for tabbed documentation
-        notebook = ttk.Notebook(frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # SEC Edgar Tab
-        sec_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(sec_frame, text="🏛️ SEC Edgar")
-        
-        sec_scroll = ScrollableFrame(sec_frame)
-        sec_scroll.pack(fill=tk.BOTH, expand=True)
-        
-        sec_content_frame = sec_scroll.scrollable_frame
-        
-        ttk.Label(sec_content_frame, text="🏛️ SEC Edgar Data Source", 
-                 font=('Arial', 16, 'bold')).pack(pady=(0, 15))
-        
-        sec_content = """
+""".strip()
+
+_SEC_DOC_CONTENT = """
 📋 Available Form Types:
 • 10-Q: Quarterly reports with unaudited financial statements
 • 10-K: Annual reports with audited financial statements  
@@ -1447,25 +1697,9 @@ Consumer: AMZN (Amazon), TSLA (Tesla), WMT (Walmart), KO (Coca-Cola)
 • All data sourced from official SEC EDGAR database
 • URLs follow SEC standard naming conventions
 • Files are organized by CIK (Central Index Key) and accession numbers
-        """
-        
-        sec_text_label = ttk.Label(sec_content_frame, text=sec_content.strip(), 
-                                  font=('Arial', 10), justify=tk.LEFT, wraplength=800)
-        sec_text_label.pack(anchor=tk.W)
-        
-        # Yahoo Finance Tab
-        yahoo_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(yahoo_frame, text="📈 Yahoo Finance")
-        
-        yahoo_scroll = ScrollableFrame(yahoo_frame)
-        yahoo_scroll.pack(fill=tk.BOTH, expand=True)
-        
-        yahoo_content_frame = yahoo_scroll.scrollable_frame
-        
-        ttk.Label(yahoo_content_frame, text="📈 Yahoo Finance Data Source", 
-                 font=('Arial', 16, 'bold')).pack(pady=(0, 15))
-        
-        yahoo_content = """
+""".strip()
+
+_YAHOO_DOC_CONTENT = """
 📊 Available Period Types:
 • Annual: Yearly financial statements (up to 10 years of history)
 • Quarterly: Quarterly financial statements (up to 5 years of history)
@@ -1496,25 +1730,9 @@ Consumer: AMZN (Amazon), TSLA (Tesla), WMT (Walmart), KO (Coca-Cola)
 • May have slight delays compared to real-time data
 • Less detailed than official SEC filings
 • Some metrics may be calculated/estimated
-        """
-        
-        yahoo_text_label = ttk.Label(yahoo_content_frame, text=yahoo_content.strip(), 
-                                    font=('Arial', 10), justify=tk.LEFT, wraplength=800)
-        yahoo_text_label.pack(anchor=tk.W)
-        
-        # Technical Tab
-        tech_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(tech_frame, text="🔧 Technical")
-        
-        tech_scroll = ScrollableFrame(tech_frame)
-        tech_scroll.pack(fill=tk.BOTH, expand=True)
-        
-        tech_content_frame = tech_scroll.scrollable_frame
-        
-        ttk.Label(tech_content_frame, text="🔧 Technical Information", 
-                 font=('Arial', 16, 'bold')).pack(pady=(0, 15))
-        
-        tech_content = """
+""".strip()
+
+_TECH_DOC_CONTENT = """
 💻 System Requirements:
 • Python 3.7 or higher
 • Required packages: tkinter, pandas, requests, yfinance
@@ -1554,25 +1772,9 @@ Consumer: AMZN (Amazon), TSLA (Tesla), WMT (Walmart), KO (Coca-Cola)
 • Ensure sufficient disk space for downloads
 • Try different time periods if data is unavailable
 • Contact support for persistent issues
-        """
-        
-        tech_text_label = ttk.Label(tech_content_frame, text=tech_content.strip(), 
-                                   font=('Arial', 10), justify=tk.LEFT, wraplength=800)
-        tech_text_label.pack(anchor=tk.W)
-        
-        # FAQ Tab
-        faq_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(faq_frame, text="❓ FAQ")
-        
-        faq_scroll = ScrollableFrame(faq_frame)
-        faq_scroll.pack(fill=tk.BOTH, expand=True)
-        
-        faq_content_frame = faq_scroll.scrollable_frame
-        
-        ttk.Label(faq_content_frame, text="❓ Frequently Asked Questions", 
-                 font=('Arial', 16, 'bold')).pack(pady=(0, 15))
-        
-        faq_content = """
+""".strip()
+
+_FAQ_DOC_CONTENT = """
 Q: Which data source should I use?
 A: Use SEC Edgar for official regulatory data and Yahoo Finance for quick analysis. SEC data is more comprehensive but slower to download.
 
@@ -1602,22 +1804,247 @@ A: SEC data is updated as companies file reports. Yahoo Finance data is updated
 
 Q: Can I use this for commercial purposes?
 A: The tool itself can be used commercially, but check the terms of service for SEC Edgar and Yahoo Finance data usage.
-        """
+""".strip()
+
+# Welcome screen sections: (frame title, body); None is the data sources comparison
+_WELCOME_SECTIONS = (
+    ("✨ Key Features", _FEATURES_TEXT),
+    ("📋 How to Use", _HOWTO_TEXT),
+    ("📊 Data Sources Comparison", None),
+    ("💡 Pro Tips", _TIPS_TEXT),
+    ("🏢 Example Companies", _EXAMPLES_TEXT),
+)
+
+# Data sources comparison columns: (heading, heading style, details, pack side, padx)
+_SOURCE_COLUMNS = (
+    ("🏛️ SEC Edgar", 'SEC.H2.TLabel', _SEC_DETAILS, tk.LEFT, (0, 10)),
+    ("📈 Yahoo Finance", 'Yahoo.H2.TLabel', _YAHOO_DETAILS, tk.RIGHT, (10, 0)),
+)
+
+# Shared pack() options for the welcome / documentation layouts
+_PACK_SECTION = {'fill': tk.X, 'pady': (0, 15)}
+_PACK_LAST_SECTION = {'fill': tk.X, 'pady': (0, 20)}
+_PACK_BODY = {'anchor': tk.W, 'fill': tk.X}
+_PACK_BUTTON = {'side': tk.LEFT, 'padx': (0, 15)}
+_PACK_FILL = {'fill': tk.BOTH, 'expand': True}
+
+# Documentation window tabs: (tab label, heading, body); None opens the FAQ in the browser
+_DOC_TABS = (
+    ("🏛️ SEC Edgar", "🏛️ SEC Edgar Data Source", _SEC_DOC_CONTENT),
+    ("📈 Yahoo Finance", "📈 Yahoo Finance Data Source", _YAHOO_DOC_CONTENT),
+    ("🔧 Technical", "🔧 Technical Information", _TECH_DOC_CONTENT),
+    ("❓ FAQ", "❓ Frequently Asked Questions", None),
+)
+
+# Emoji (plus variation selector and one trailing space) for Tk builds without emoji fonts
+_EMOJI_RE = re.compile("[\u2600-\u27bf\U0001f000-\U0001faff]\ufe0f? ?")
+
+# Emoji-free variant of every welcome / documentation string, built once at import
+_PLAIN_TEXT = {
+    text: _EMOJI_RE.sub("", text)
+    for text in itertools.chain(
+        itertools.chain.from_iterable(_WELCOME_SECTIONS),
+        itertools.chain.from_iterable(column[:3:2] for column in _SOURCE_COLUMNS),
+        itertools.chain.from_iterable(_DOC_TABS),
+    )
+    if text is not None
+}
+
+# Set by main(): X11 Tk falls back glyph by glyph for emoji, so show the plain variants there
+_STRIP_EMOJI = [False]
+
+
+def _ui_text(text):
+    """Return text, or its emoji-free variant (precomputed for the tables) when _STRIP_EMOJI is set"""
+    if not _STRIP_EMOJI[0]:
+        return text
+    plain = _PLAIN_TEXT.get(text)
+    return plain if plain is not None else _EMOJI_RE.sub("", text)
+
+
+# FAQ page opened in the system browser; written on first use
+_FAQ_HTML_PATH = Path(tempfile.gettempdir()) / "dce_faq.html"
+_faq_html_written = [False]
+
+
+def _open_faq_in_browser():
+    """Write the FAQ as a static HTML page (once per run) and open it in the browser"""
+    if not _faq_html_written[0]:
+        entries = "\n".join(
+            "<p>" + "<br>".join(html.escape(line) for line in block.splitlines()) + "</p>"
+            for block in _FAQ_DOC_CONTENT.split("\n\n")
+        )
+        page = (
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+            "<title>Frequently Asked Questions</title>"
+            "<style>body { font-family: Arial, sans-serif; max-width: 800px; margin: 2em auto; }</style>"
+            f"</head><body>\n<h1>❓ Frequently Asked Questions</h1>\n{entries}\n</body></html>\n"
+        )
+        try:
+            _FAQ_HTML_PATH.write_text(page, encoding="utf-8")
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not write FAQ page: {e}")
+            return
+        _faq_html_written[0] = True
+    webbrowser.open(_FAQ_HTML_PATH.as_uri())
+
+
+class WelcomeWindow:
+    """Enhanced welcome screen with instructions"""
+    def __init__(self, root):
+        self.root = root
+        self._doc_window = None  # built on first open, then hidden / shown
+        self.show_welcome()
+    
+    def show_welcome(self):
+        """Show welcome dialog with enhanced styling"""
+        welcome = tk.Toplevel(self.root)
+        # Stay hidden while the content is packed; Tk lays it out once before showing
+        welcome.withdraw()
+        welcome.title("Welcome to Enhanced Financial Data Extractor")
+        welcome.geometry("750x650")
+        welcome.resizable(False, False)
+        welcome.transient(self.root)
         
-        faq_text_label = ttk.Label(faq_content_frame, text=faq_content.strip(), 
-                                  font=('Arial', 10), justify=tk.LEFT, wraplength=800)
-        faq_text_label.pack(anchor=tk.W)
+        # Center the window
+        x = (welcome.winfo_screenwidth() // 2) - (750 // 2)
+        y = (welcome.winfo_screenheight() // 2) - (650 // 2)
+        welcome.geometry(f"750x650+{x}+{y}")
+        
+        # Create scrollable frame for welcome content
+        welcome_scroll = ScrollableFrame(welcome)
+        welcome_scroll.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        frame = welcome_scroll.scrollable_frame
+        
+        # Title section
+        title_frame = ttk.Frame(frame)
+        title_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        ttk.Label(title_frame, text=_ui_text("🚀 Enhanced Financial Data Extractor"), 
+                 style='Title.TLabel').pack()
+        ttk.Label(title_frame, text="Professional Financial Data Acquisition Tool", 
+                 style='Subtitle.TLabel').pack()
+        
+        # Content sections, top to bottom (the comparison section has its own builder)
+        for index, (title, body) in enumerate(_WELCOME_SECTIONS):
+            section_frame = ttk.LabelFrame(frame, text=_ui_text(title), padding="15")
+            is_last = index == len(_WELCOME_SECTIONS) - 1
+            section_frame.pack(**(_PACK_LAST_SECTION if is_last else _PACK_SECTION))
+            
+            if body is None:
+                self._build_sources_comparison(section_frame)
+            else:
+                _static_text(section_frame, _ui_text(body)).pack(**_PACK_BODY)
+        
+        # Button frame
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(20, 0))
+        
+        ttk.Button(button_frame, text=_ui_text("🚀 Get Started"), 
+                  command=welcome.destroy).pack(**_PACK_BUTTON)
+        ttk.Button(button_frame, text=_ui_text("📚 Documentation"), 
+                  command=partial(self.show_documentation, welcome)).pack(**_PACK_BUTTON)
+        ttk.Button(button_frame, text=_ui_text("❌ Exit"), 
+                  command=self.root.quit).pack(side=tk.LEFT)
+        
+        welcome.update_idletasks()
+        welcome.deiconify()
+        # A grab needs a viewable window
+        welcome.grab_set()
+    
+    def _build_sources_comparison(self, parent):
+        """Fill the data sources section with one column per source"""
+        comparison_frame = ttk.Frame(parent)
+        comparison_frame.pack(fill=tk.X)
+        
+        for heading, heading_style, details, side, padx in _SOURCE_COLUMNS:
+            column = ttk.Frame(comparison_frame)
+            column.pack(side=side, fill=tk.BOTH, expand=True, padx=padx)
+            
+            ttk.Label(column, text=_ui_text(heading), 
+                     style=heading_style).pack()
+            
+            ttk.Label(column, text=_ui_text(details), style='Small.TLabel', 
+                     justify=tk.LEFT).pack(anchor=tk.W)
+    
+    def show_documentation(self, parent_window):
+        """Show comprehensive documentation window"""
+        # Reuse the window built by an earlier open (it dies with its parent)
+        if self._doc_window is not None and self._doc_window.winfo_exists():
+            self._doc_window.deiconify()
+            self._doc_window.lift()
+            return
+        
+        doc_window = tk.Toplevel(parent_window)
+        doc_window.withdraw()
+        doc_window.title(_ui_text("📚 Documentation & Help"))
+        doc_window.geometry("900x700")
+        doc_window.resizable(False, False)
+        
+        # Plain container - each tab scrolls on its own, so the notebook doesn't need to
+        frame = ttk.Frame(doc_window)
+        frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Fixed size: children never change the window / container size
+        for container in (doc_window, frame):
+            container.pack_propagate(False)
+        
+        # Create notebook for tabbed documentation
+        notebook = ttk.Notebook(frame)
+        notebook.pack(**_PACK_FILL)
+        
+        # Tab bodies are built the first time each tab is shown
+        builders = {}
+        for tab_text, heading, content in _DOC_TABS:
+            tab_frame = ttk.Frame(notebook, padding="20")
+            notebook.add(tab_frame, text=_ui_text(tab_text))
+            builders[str(tab_frame)] = (tab_frame, heading, content)
+        
+        def _on_tab(event=None):
+            pending = builders.pop(notebook.select(), None)
+            if pending is not None:
+                self._build_doc_tab(*pending)
+        
+        notebook.bind("<<NotebookTabChanged>>", _on_tab)
+        _on_tab()
         
         # Close button
         close_frame = ttk.Frame(frame)
         close_frame.pack(pady=(20, 0))
         
-        ttk.Button(close_frame, text="✅ Close Documentation", 
-                  command=doc_window.destroy).pack()
+        ttk.Button(close_frame, text=_ui_text("✅ Close Documentation"), 
+                  command=doc_window.withdraw).pack()
+        
+        # Closing only hides the window so the next open skips rebuilding it
+        doc_window.protocol("WM_DELETE_WINDOW", doc_window.withdraw)
+        self._doc_window = doc_window
+        
+        doc_window.update_idletasks()
+        doc_window.deiconify()
+    
+    def _build_doc_tab(self, tab_frame, heading, content):
+        """Fill one documentation tab with its scrollable heading and text"""
+        tab_scroll = ScrollableFrame(tab_frame)
+        tab_scroll.pack(**_PACK_FILL)
+        
+        content_frame = tab_scroll.scrollable_frame
+        
+        ttk.Label(content_frame, text=_ui_text(heading), 
+                 style='H1.TLabel').pack(pady=_PACK_SECTION['pady'])
+        
+        if content is None:
+            # Long static Q&A - let the browser lay it out
+            ttk.Button(content_frame, text=_ui_text("🌐 Open FAQ in Browser"), 
+                      command=_open_faq_in_browser).pack()
+            return
+        
+        _static_text(content_frame, _ui_text(content), width=100).pack(**_PACK_BODY)
 
 
 def main():
     """Main function to run the application"""
+    root = None
     try:
         # Initialize root window with professional styling
         root = tk.Tk()
@@ -1625,37 +2052,36 @@ def main():
         
         # Configure professional styling
         style = ttk.Style()
-        available_themes = style.theme_names()
-        
-        # Try to set a professional theme
-        if 'clam' in available_themes:
-            style.theme_use('clam')
-        elif 'vista' in available_themes:
-            style.theme_use('vista')
-        elif 'default' in available_themes:
-            style.theme_use('default')
+        
+        # Try to set a professional theme (first one this Tk build has)
+        for theme in ('clam', 'vista', 'default'):
+            try:
+                style.theme_use(theme)
+                break
+            except tk.TclError:
+                continue
             
         # Configure common style elements
-        style.configure('TLabel', font=('Arial', 10))
-        style.configure('TButton', font=('Arial', 10))
+        _create_fonts(root)
+        _STRIP_EMOJI[0] = root.tk.call('tk', 'windowingsystem') == 'x11'
+        _configure_label_styles(style)
+        style.configure('TButton', font=_FONTS['body'])
         style.configure('TFrame', background='#f0f0f0')
         
         # Initialize the main application
         app = EnhancedFinancialExtractor(root)
         
-        # Show welcome screen
-        welcome = WelcomeWindow(root)
+        # Show welcome screen once the main window has had its first idle pass (and paint)
+        root.after_idle(lambda: WelcomeWindow(root))
         
         # Start the application
         root.mainloop()
         
     except Exception as e:
-        # Handle any initialization errors
-        error_msg = f"Application initialization failed: {str(e)}"
-        if 'root' in locals():
-            messagebox.showerror("Error", error_msg)
-        else:
-            print(error_msg)
+        # Fatal initialization error - report on stderr and exit without more Tk work
+        sys.stderr.write(f"Application initialization failed: {e}\n")
+        if root is not None:
+            root.destroy()
         sys.exit(1)
 
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session setup for the SEC / Yahoo Finance data sources
+One pooled keep-alive session with retries on rate limits and server errors,
+throttled to SEC's fair-access limit of 10 requests per second
+(yfinance calls are limited separately to 2 per second, jittered)
+"""
+
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SEC_USER_AGENT = 'Financial Report Finder zhengdingnan@gmail.com'
+POOL_SIZE = 10
+SEC_MAX_REQUESTS_PER_SECOND = 10
+YAHOO_MAX_CALLS_PER_SECOND = 2
+YAHOO_JITTER_SECONDS = 0.3
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent"""
+
+    def __init__(self, rate, capacity=None, jitter=0):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.jitter = jitter
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available (plus up to jitter seconds)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+        if self.jitter:
+            # Spread out requests released together so they don't arrive as a burst
+            time.sleep(random.uniform(0, self.jitter))
+
+
+# SEC's limit is per client, so every session in the process shares one bucket
+SEC_RATE_LIMITER = TokenBucket(SEC_MAX_REQUESTS_PER_SECOND)
+# Yahoo has no published limit but answers bursts with 429s. yfinance talks to Yahoo
+# over its own session, so this counts yfinance calls (one .info / .history / statement
+# access), not HTTP requests - a first .info also fetches a cookie and crumb
+YAHOO_RATE_LIMITER = TokenBucket(YAHOO_MAX_CALLS_PER_SECOND, jitter=YAHOO_JITTER_SECONDS)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from rate_limiter before each request"""
+
+    def __init__(self, rate_limiter=SEC_RATE_LIMITER, **kwargs):
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.rate_limiter.acquire()
+        return super().send(request, **kwargs)
+
+
+def create_session(user_agent=SEC_USER_AGENT, pool_size=POOL_SIZE, rate_limiter=SEC_RATE_LIMITER):
+    """
+    Create a requests.Session with connection pooling, retry/backoff and rate limiting
+
+    Args:
+        user_agent (str): User-Agent sent with every request (SEC requires a contact)
+        pool_size (int): Number of pooled connections per host (callers block beyond it)
+        rate_limiter (TokenBucket): Shared limiter, or None for hosts without SEC's limit
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': user_agent})
+
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    # pool_block: threads beyond pool_size wait for a pooled connection instead of
+    # opening throwaway ones (each with its own TCP + TLS handshake)
+    pool_kwargs = dict(pool_connections=pool_size, pool_maxsize=pool_size,
+                       max_retries=retry, pool_block=True)
+    if rate_limiter is not None:
+        adapter = RateLimitedAdapter(rate_limiter=rate_limiter, **pool_kwargs)
+    else:
+        adapter = HTTPAdapter(**pool_kwargs)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -4,25 +4,86 @@ Financial Report Finder - Interactive CLI Tool with Download Functionality
 Run with: python finder.py
 """
 
-import requests
 import json
-import re
-from datetime import datetime
-import sys
 import os
+import shutil
 from pathlib import Path
 import time
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import io
+import zipfile
+import xml.etree.ElementTree as ET
 import pandas as pd
 import openpyxl
-import io
-from sec_api import RenderApi
+from http_utils import create_session, SEC_USER_AGENT, SEC_RATE_LIMITER
+
+try:
+    import python_calamine  # Rust-backed Excel reader (optional, pandas >= 2.2)
+except ImportError:
+    python_calamine = None
+
+try:
+    import orjson  # faster parsing of the multi-MB SEC JSON payloads (optional)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+TICKERS_CACHE_PATH = Path.home() / ".cache" / "fin_extractor" / "tickers.parquet"
+TICKERS_REFRESH_SECONDS = 7 * 24 * 60 * 60   # refresh the ticker table weekly
+SUBMISSIONS_CACHE_DIR = Path.home() / ".cache" / "fin_extractor" / "submissions"
+FILING_COLUMNS = ['form', 'filingDate', 'accessionNumber', 'reportDate', 'primaryDocument']
+SESSION_POOL_SIZE = 16                       # keep-alive connections to sec.gov for a finder's own session
+REPORT_DOWNLOAD_WORKERS = 5                  # concurrent report downloads per filing
+DOWNLOAD_CHUNK_SIZE = 64 * 1024              # copy buffer when streaming downloads to disk
+XLSX_SHEET_TAG = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}sheet'
+_FILENAME_TRANS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))  # characters not allowed in file names
+
+# Offline fallback CIKs for well-known tickers
+POPULAR_TICKERS = {
+    'AAPL': '0000320193',   # Apple Inc
+    'MSFT': '0000789019',   # Microsoft Corporation
+    'GOOGL': '0001652044',  # Alphabet Inc
+    'GOOG': '0001652044',   # Alphabet Inc
+    'AMZN': '0001018724',   # Amazon.com Inc
+    'TSLA': '0001318605',   # Tesla Inc
+    'META': '0001326801',   # Meta Platforms Inc
+    'NVDA': '0001045810',   # NVIDIA Corporation
+    'NFLX': '0001065280',   # Netflix Inc
+    'EQIX': '0001101239',   # Equinix Inc
+    'CRM': '0001108524',    # Salesforce Inc
+    'ORCL': '0001341439',   # Oracle Corporation
+    'IBM': '0000051143',    # International Business Machines
+    'INTC': '0000050863',   # Intel Corporation
+    'AMD': '0000002488',    # Advanced Micro Devices
+    'UBER': '0001543151',   # Uber Technologies Inc
+    'SPOT': '0001639920',   # Spotify Technology SA
+    'PYPL': '0001633917',   # PayPal Holdings Inc
+    'DIS': '0001744489',    # Walt Disney Company
+    'KO': '0000021344',     # Coca-Cola Company
+    'PEP': '0000077476',    # PepsiCo Inc
+    'WMT': '0000104169',    # Walmart Inc
+    'JPM': '0000019617',    # JPMorgan Chase & Co
+    'BAC': '0000070858',    # Bank of America Corporation
+    'V': '0001403161',      # Visa Inc
+    'MA': '0001141391',     # Mastercard Incorporated
+    'IRM': '0001020569',    # Iron Mountain Inc
+    'DLR': '0001297996',    # Digital Realty Trust Inc
+    'AMT': '0001053507',    # American Tower Corporation
+    'VRT': '0001674101',    # Vertiv Holdings Co
+    'LUMN': '0000018926',   # Lumen Technologies Inc
+    'SWCH': '0001710583',   # Switch Inc
+    'AVGO': '0001730168',   # Broadcom Inc
+    'GDS': '0001526125',    # GDS Holdings Ltd
+}
 
 class FinancialReportFinder:
-    def __init__(self, sec_api_key=None):
+    def __init__(self, sec_api_key=None, session=None):
         """Initialize the Financial Report Finder with optional SEC API integration"""
         self.headers = {
-            'User-Agent': 'Financial Report Finder zhengdingnan@gmail.com',
+            'User-Agent': SEC_USER_AGENT,
             'Accept-Encoding': 'gzip, deflate',
             'Accept': 'application/json, text/html, */*'
         }
@@ -30,7 +91,17 @@ class FinancialReportFinder:
         self.sec_api_key = sec_api_key
         self.render_api = None
         
+        # Pooled keep-alive session (shared with the caller if one is passed in)
+        self._owns_session = session is None
+        self.session = create_session(pool_size=SESSION_POOL_SIZE) if session is None else session
+        self.session.headers.update(self.headers)
         
+        # SEC ticker table, loaded lazily (indexed on ticker / cik)
+        self._tickers_df = None
+        self._tickers_by_cik = None
+        self._titles_blob = None     # upper-case titles joined by "\n", in ticker table order
+        self._title_offsets = None   # start offset of each title in _titles_blob
+        self._tickers_lock = threading.Lock()
         
         # Try to initialize SEC API if key provided
         if sec_api_key:
@@ -45,6 +116,70 @@ class FinancialReportFinder:
                 print(f"⚠️  SEC API initialization failed: {e}")
                 print("   Using basic download method instead")
     
+    def close(self):
+        """Close the HTTP session if this finder created it"""
+        if self._owns_session:
+            self.session.close()
+    
+    def __del__(self):
+        # __init__ may have failed before the session existed
+        if getattr(self, '_owns_session', False):
+            self.close()
+    
+    def _load_tickers_df(self):
+        """
+        Load the SEC ticker table, indexed on ticker
+        
+        The table is cached as Parquet in TICKERS_CACHE_PATH and re-downloaded
+        from company_tickers.json once the file is older than a week.
+        
+        Returns:
+            pd.DataFrame: columns cik_str and title, indexed on ticker
+        """
+        with self._tickers_lock:
+            if self._tickers_df is not None:
+                return self._tickers_df
+            
+            df = None
+            try:
+                if time.time() - TICKERS_CACHE_PATH.stat().st_mtime < TICKERS_REFRESH_SECONDS:
+                    df = pd.read_parquet(TICKERS_CACHE_PATH)
+            except (OSError, ImportError, ValueError):
+                df = None
+            
+            if df is None:
+                response = self.session.get(COMPANY_TICKERS_URL, timeout=10)
+                response.raise_for_status()
+                # The table is several MB of JSON; it should always come compressed
+                if response.headers.get('Content-Encoding') not in ('gzip', 'deflate'):
+                    print("⚠️  company_tickers.json was served uncompressed")
+                
+                df = pd.DataFrame(list(_json_loads(response.content).values()))
+                df['ticker'] = df['ticker'].astype(str).str.upper()
+                df = df.drop_duplicates('ticker').set_index('ticker')
+                
+                try:
+                    TICKERS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = TICKERS_CACHE_PATH.with_suffix('.tmp')
+                    df.to_parquet(tmp_path)
+                    os.replace(tmp_path, TICKERS_CACHE_PATH)
+                except (OSError, ImportError, ValueError) as e:
+                    # No parquet engine (pyarrow / fastparquet) - keep it in memory only
+                    print(f"⚠️  Could not cache ticker table: {e}")
+            
+            self._tickers_by_cik = df.reset_index().drop_duplicates('cik_str').set_index('cik_str')
+            
+            # Name searches scan one string with str.find instead of every row
+            titles = df['title'].astype(str).str.upper().tolist()
+            offsets, pos = [], 0
+            for title in titles:
+                offsets.append(pos)
+                pos += len(title) + 1
+            self._titles_blob = "\n".join(titles)
+            self._title_offsets = offsets
+            self._tickers_df = df
+            return df
+    
     def get_company_cik(self, ticker_or_name):
         """
         Get company CIK from ticker symbol or company name using multiple methods
@@ -57,23 +192,23 @@ class FinancialReportFinder:
         """
         print(f"🔍 Searching for: {ticker_or_name}")
         
-        # Method 1: Try the company tickers JSON (primary method)
+        # Method 1: Try the company tickers table (primary method)
         try:
-            url = "https://www.sec.gov/files/company_tickers.json"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            companies = response.json()
+            df = self._load_tickers_df()
             search_term = ticker_or_name.upper().strip()
             
-            for company_data in companies.values():
-                ticker = company_data.get('ticker', '').upper()
-                title = company_data.get('title', '').upper()
-                
-                if search_term == ticker or search_term in title:
-                    cik = str(company_data['cik_str']).zfill(10)
-                    print(f"✅ Found: {company_data['title']} ({company_data['ticker']}) - CIK: {cik}")
-                    return cik
+            if search_term in df.index:
+                ticker = search_term
+            else:
+                # First title containing the term (a term never spans titles - no "\n")
+                pos = self._titles_blob.find(search_term) if search_term and "\n" not in search_term else -1
+                ticker = df.index[bisect_right(self._title_offsets, pos) - 1] if pos >= 0 else None
+            
+            if ticker is not None:
+                company_data = df.loc[ticker]
+                cik = str(company_data['cik_str']).zfill(10)
+                print(f"✅ Found: {company_data['title']} ({ticker}) - CIK: {cik}")
+                return cik
             
         except Exception as e:
             print(f"⚠️  Primary search method failed, trying alternatives...")
@@ -81,79 +216,27 @@ class FinancialReportFinder:
         # Method 2: Try the company tickers exchange JSON (alternative endpoint)
         try:
             url = "https://www.sec.gov/files/company_tickers_exchange.json"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             search_term = ticker_or_name.upper().strip()
             
-            for field_name, companies in data['fields'].items():
-                for company in companies:
-                    if len(company) >= 3:
-                        ticker = str(company[0]).upper() if company[0] else ""
-                        title = str(company[1]).upper() if company[1] else ""
-                        cik_val = company[2] if len(company) > 2 else None
-                        
-                        if search_term == ticker or search_term in title:
-                            cik = str(cik_val).zfill(10)
-                            print(f"✅ Found: {company[1]} ({company[0]}) - CIK: {cik}")
-                            return cik
+            # Rows are [cik, name, ticker, exchange] (column names are in data['fields'])
+            for cik_val, name, ticker, *_ in data['data']:
+                if (ticker and ticker.upper() == search_term) or (name and search_term in name.upper()):
+                    cik = str(cik_val).zfill(10)
+                    print(f"✅ Found: {name} ({ticker}) - CIK: {cik}")
+                    return cik
             
         except Exception:
             pass
         
         # Method 3: Hardcoded popular tickers (fallback)
-        popular_tickers = {
-            'AAPL': '0000320193',    # Apple Inc
-            'MSFT': '0000789019',    # Microsoft Corporation
-            'GOOGL': '0001652044',   # Alphabet Inc
-            'GOOG': '0001652044',    # Alphabet Inc
-            'AMZN': '0001018724',    # Amazon.com Inc
-            'TSLA': '0001318605',    # Tesla Inc
-            'META': '0001326801',    # Meta Platforms Inc
-            'NVDA': '0001045810',    # NVIDIA Corporation
-            'NFLX': '0001065280',    # Netflix Inc
-            'EQIX': '0001101239',    # Equinix Inc
-            'CRM': '0001108524',     # Salesforce Inc
-            'ORCL': '0001341439',    # Oracle Corporation
-            'IBM': '0000051143',     # International Business Machines
-            'INTC': '0000050863',    # Intel Corporation
-            'AMD': '0000002488',     # Advanced Micro Devices
-            'UBER': '0001543151',    # Uber Technologies Inc
-            'SPOT': '0001639920',    # Spotify Technology SA
-            'PYPL': '0001633917',    # PayPal Holdings Inc
-            'DIS': '0001001039',     # Walt Disney Company
-            'KO': '0000021344',      # Coca-Cola Company
-            'PEP': '0000077476',     # PepsiCo Inc
-            'WMT': '0000104169',     # Walmart Inc
-            'JPM': '0000019617',     # JPMorgan Chase & Co
-            'BAC': '0000070858',     # Bank of America Corporation
-            'V': '0001403161',       # Visa Inc
-            'MA': '0001141391',      # Mastercard Incorporated
-            'IRM': '0001020569',     # Iron Mountain Inc
-            'DLR': '0001558370',     # Digital Realty Trust Inc
-            'AMT': '0001065280',     # American Tower Corporation
-            'VRT': '0001065280',     # Vertiv Holdings Inc
-            'LUMN': '0001065280',     # Luminex Corporation
-            'SWCH': '0001065280',     # Switch Inc
-            'MSFT': '0000789019',     # Microsoft Corporation
-            'NVDA': '0001045810',     # NVIDIA Corporation
-            'AVGO': '0001065280',     # Broadcom Inc
-            'ORCL': '0001341439',     # Oracle Corporation
-            'GDS': '0001065280',     # Global Data Centers Inc  
-            'EQIX': '0001101239',     # Equinix Inc
-            'CRM': '0001108524',     # Salesforce Inc
-            'IBM': '0000051143',     # International Business Machines
-            'INTC': '0000050863',    # Intel Corporation
-            'AMD': '0000002488',     # Advanced Micro Devices
-            'UBER': '0001543151',    # Uber Technologies Inc
-            'SPOT': '0001639920',    # Spotify Technology SA
-            'PYPL': '0001633917',    # PayPal Holdings Inc
-        }
         
         ticker_upper = ticker_or_name.upper().strip()
-        if ticker_upper in popular_tickers:
-            cik = popular_tickers[ticker_upper]
+        if ticker_upper in POPULAR_TICKERS:
+            cik = POPULAR_TICKERS[ticker_upper]
             print(f"✅ Found via database: {ticker_upper} - CIK: {cik}")
             return cik
         
@@ -161,63 +244,90 @@ class FinancialReportFinder:
         return None
     
     def get_company_info_from_cik(self, cik):
+        """Look up ticker and title for a CIK in the cached ticker table (no extra request)"""
         try:
             # Convert CIK to proper format (10-digit string with leading zeros)
             if isinstance(cik, str):
                 cik = cik.strip()
-            cik_formatted = f"{int(cik):010d}"
-            
-            # SEC company tickers endpoint
-            url = "https://www.sec.gov/files/company_tickers.json"
-            headers = {'User-Agent': 'zhengdingnan@gmail.com'}
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            companies = response.json()
-            
-            # Search for the CIK in the data
-            for company_data in companies.values():
-                if f"{company_data['cik_str']:010d}" == cik_formatted:
-                    return {
-                        'cik': company_data['cik_str'],
-                        'ticker': company_data['ticker'],
-                        'title': company_data['title']
-                    }
+            cik_int = int(cik)
+            
+            # Look the CIK up in the SEC company tickers table
+            self._load_tickers_df()
+            if cik_int in self._tickers_by_cik.index:
+                company_data = self._tickers_by_cik.loc[cik_int]
+                return {
+                    'cik': cik_int,
+                    'ticker': company_data['ticker'],
+                    'title': company_data['title']
+                }
+            return None
             
         except Exception as e:
             print(f"Error fetching company info for CIK {cik}: {e}")
             return None
+    
+    def get_recent_submissions(self, cik):
+        """
+        Get the columnar filings.recent block of a company's submissions.json
         
-    def get_recent_filings(self, cik, form_type="10-Q", count=6):
-        """Get recent filings for a company"""
+        The last response is kept in SUBMISSIONS_CACHE_DIR with its ETag /
+        Last-Modified headers, and revalidated with a conditional GET - an
+        unchanged filing index comes back as an empty 304.
+        """
+        print(f"📋 Getting recent filings for CIK {cik}...")
+        url = f"https://data.sec.gov/submissions/CIK{cik}.json"
+        cache_path = SUBMISSIONS_CACHE_DIR / f"CIK{cik}.json"
+        
+        cached = None
+        request_headers = {}
         try:
-            print(f"📋 Getting recent {form_type} filings...")
-            url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
-            filings = data['filings']['recent']
-            
-            # Filter by form type
-            filtered_filings = []
-            for i, form in enumerate(filings['form']):
-                if form == form_type and len(filtered_filings) < count:
-                    filing_info = {
-                        'form': form,
-                        'filingDate': filings['filingDate'][i],
-                        'accessionNumber': filings['accessionNumber'][i],
-                        'reportDate': filings['reportDate'][i],
-                        'primaryDocument': filings['primaryDocument'][i]
-                    }
-                    filtered_filings.append(filing_info)
-            
-            return filtered_filings
-            
+            with open(cache_path, 'rb') as f:
+                cached = _json_loads(f.read())
+            if cached.get('etag'):
+                request_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                request_headers['If-Modified-Since'] = cached['last_modified']
+        except (OSError, ValueError):
+            cached = None
+        
+        response = self.session.get(url, headers=request_headers, timeout=15)
+        if response.status_code == 304 and cached is not None:
+            return cached['recent']
+        response.raise_for_status()
+        
+        recent = _json_loads(response.content)['filings']['recent']
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            try:
+                SUBMISSIONS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'etag': etag, 'last_modified': last_modified, 'recent': recent}, f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"⚠️  Could not cache submissions for CIK {cik}: {e}")
+        
+        return recent
+    
+    def get_submissions_df(self, cik):
+        """Get a company's recent filings (all form types) as a DataFrame"""
+        try:
+            # filings.recent is already columnar - one list per field
+            return pd.DataFrame(self.get_recent_submissions(cik), columns=FILING_COLUMNS)
         except Exception as e:
             print(f"❌ Error getting filings: {e}")
-            return []
+            return pd.DataFrame(columns=FILING_COLUMNS)
+    
+    def filter_filings(self, submissions_df, form_type="10-Q", count=6):
+        """Pick the most recent count filings of form_type from a submissions DataFrame"""
+        matches = submissions_df[submissions_df['form'] == form_type]
+        return matches.head(count).to_dict('records')
+    
+    def get_recent_filings(self, cik, form_type="10-Q", count=6):
+        """Get recent filings for a company"""
+        return self.filter_filings(self.get_submissions_df(cik), form_type, count)
     
     def generate_financial_report_urls(self, cik, accession_number):
         """Generate URLs for financial reports"""
@@ -269,65 +379,122 @@ class FinancialReportFinder:
         filename = f"{ticker.upper()}-{base_name}-{safe_end_date}{ext}"
         return filename
     
-    def download_file_basic(self, url, filepath):
-        """Download file using basic requests (fallback method)"""
-        try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+    def _stream_to_file(self, url, filepath):
+        """Stream url straight into filepath in DOWNLOAD_CHUNK_SIZE pieces; returns bytes written"""
+        with self.session.get(url, timeout=30, stream=True) as response:
             response.raise_for_status()
-            
+            response.raw.decode_content = True  # undo gzip transfer encoding
             with open(filepath, 'wb') as f:
-                f.write(response.content)
-            return True
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                bytes_written = f.tell()
+        return bytes_written
+    
+    def download_file_basic(self, url, filepath):
+        """Download file using basic requests (fallback method); returns bytes written, 0 on failure"""
+        try:
+            return self._stream_to_file(url, filepath)
         except Exception as e:
             print(f"❌ Basic download failed: {e}")
-            return False
+            return 0
     
     def download_file_sec_api(self, url, filepath):
-        """Download file using SEC API (enhanced method)"""
+        """Download file using SEC API (enhanced method); returns bytes written, 0 on failure"""
         try:
             if not self.render_api:
-                return False
+                return 0
             
             # Use SEC API for better reliability
+            SEC_RATE_LIMITER.acquire()
             file_content = self.render_api.get_file(url, return_binary=True)
             
             with open(filepath, 'wb') as f:
-                f.write(file_content)
-            return True
+                return f.write(file_content)
         except Exception as e:
             print(f"❌ SEC API download failed: {e}")
-            return False
+            return 0
+    
+    def _excel_source(self, file_content):
+        """Wrap in-memory Excel bytes in BytesIO; file paths are passed through as-is"""
+        if isinstance(file_content, (bytes, bytearray, memoryview)):
+            return io.BytesIO(file_content)
+        return file_content
+    
+    def _open_excel(self, file_content):
+        """Open an Excel source (bytes, path or an already open pd.ExcelFile) for repeated sheet reads"""
+        if isinstance(file_content, pd.ExcelFile):
+            return file_content
+        if python_calamine is not None:
+            try:
+                return pd.ExcelFile(self._excel_source(file_content), engine='calamine')
+            except ValueError:
+                pass  # pandas < 2.2 has no calamine engine
+        # pandas' openpyxl reader loads read_only / data_only, so formulas are not evaluated
+        return pd.ExcelFile(self._excel_source(file_content), engine='openpyxl')
+    
+    def _sheet_names_from_zip(self, file_content):
+        """Read sheet names straight from xl/workbook.xml; None if the file isn't a plain XLSX"""
+        try:
+            with zipfile.ZipFile(self._excel_source(file_content)) as archive:
+                workbook_xml = archive.read('xl/workbook.xml')
+            return [sheet.get('name') for sheet in ET.fromstring(workbook_xml).iter(XLSX_SHEET_TAG)]
+        except (zipfile.BadZipFile, KeyError, ET.ParseError):
+            return None
+    
+    def get_excel_sheet_names(self, file_content):
+        """Return the sheet names of an Excel file (bytes or file path) without reading any cells"""
+        try:
+            # The workbook part lists every sheet - no need to initialize a reader
+            sheet_names = self._sheet_names_from_zip(file_content)
+            if sheet_names is not None:
+                return sheet_names
+            
+            if python_calamine is not None:
+                source = self._excel_source(file_content)
+                if isinstance(source, (str, os.PathLike)):
+                    return python_calamine.CalamineWorkbook.from_path(os.fspath(source)).sheet_names
+                return python_calamine.CalamineWorkbook.from_filelike(source).sheet_names
+            
+            workbook = openpyxl.load_workbook(self._excel_source(file_content), read_only=True, keep_links=False)
+            try:
+                return workbook.sheetnames
+            finally:
+                workbook.close()
+        except Exception as e:
+            print(f"❌ Error reading Excel sheet names: {e}")
+            return []
     
     def analyze_excel_file(self, file_content):
-        """Analyze Excel file and return sheet information"""
+        """Analyze Excel file (bytes or file path) and return sheet information"""
         if not self.pandas_available:
             return None
         
         try:
-            import pandas as pd
-            import openpyxl
-            
-            # Read Excel file from bytes
-            excel_file = io.BytesIO(file_content)
-            
-            # Get all sheet names
-            workbook = openpyxl.load_workbook(excel_file, read_only=True)
-            sheet_names = workbook.sheetnames
-            workbook.close()
-            
-            # Analyze each sheet
-            excel_file.seek(0)  # Reset file pointer
+            # One streaming read-only pass - header row, a couple of sample rows and
+            # the declared dimensions per sheet, without building DataFrames
+            workbook = openpyxl.load_workbook(self._excel_source(file_content), read_only=True,
+                                              data_only=True, keep_links=False)
+        except Exception as e:
+            print(f"❌ Error analyzing Excel file: {e}")
+            return None
+        
+        try:
             sheet_info = {}
             
-            for sheet_name in sheet_names:
+            for sheet_name in workbook.sheetnames:
                 try:
-                    # Read just the first few rows to get an idea of content
-                    df = pd.read_excel(excel_file, sheet_name=sheet_name, nrows=5)
+                    worksheet = workbook[sheet_name]
+                    rows = worksheet.iter_rows(max_row=3, values_only=True)
+                    header = next(rows, ())
+                    # Same labels pandas would give the header cells
+                    columns = [str(value) if value is not None else f"Unnamed: {i}"
+                               for i, value in enumerate(header)]
+                    sample_data = [dict(zip(columns, row)) for row in rows]
                     
+                    n_rows = (worksheet.max_row or 1) - 1
                     sheet_info[sheet_name] = {
-                        'columns': list(df.columns),
-                        'shape': f"{len(df.index)}+ rows x {len(df.columns)} columns",
-                        'sample_data': df.head(2).to_dict('records') if not df.empty else []
+                        'columns': columns,
+                        'shape': f"{n_rows} rows x {worksheet.max_column or len(columns)} columns",
+                        'sample_data': sample_data
                     }
                 except Exception as e:
                     sheet_info[sheet_name] = {
@@ -338,10 +505,8 @@ class FinancialReportFinder:
                     }
             
             return sheet_info
-            
-        except Exception as e:
-            print(f"❌ Error analyzing Excel file: {e}")
-            return None
+        finally:
+            workbook.close()
     
     def select_excel_sheets_to_export(self, sheet_info):
         """Let user select which Excel sheets to export as CSV"""
@@ -419,15 +584,22 @@ class FinancialReportFinder:
             except ValueError:
                 print("❌ Invalid input. Use numbers separated by commas, 'all', 'auto', or 'skip'")
     
+    def _write_csv(self, df, csv_filepath):
+        """Write df to CSV without its index; returns bytes written"""
+        # Always pandas' writer, so every exported sheet gets the same quoting and number format
+        with open(csv_filepath, 'wb') as f:
+            df.to_csv(f, index=False)
+            return f.tell()
+    
     def export_excel_sheets_to_csv(self, file_content, selected_sheets, download_dir, ticker, report_date):
-        """Export selected Excel sheets to CSV files"""
+        """Export selected Excel sheets (from bytes, a file path or an open pd.ExcelFile) to CSV files"""
         if not self.pandas_available or not selected_sheets:
             return 0
         
+        owns_file = not isinstance(file_content, pd.ExcelFile)
+        excel_file = None
         try:
-            import pandas as pd
-            
-            excel_file = io.BytesIO(file_content)
+            excel_file = self._open_excel(file_content)
             exported_count = 0
             
             print(f"\n📤 EXPORTING SHEETS TO CSV:")
@@ -435,18 +607,16 @@ class FinancialReportFinder:
             for sheet_name in selected_sheets:
                 try:
                     # Read the entire sheet
-                    df = pd.read_excel(excel_file, sheet_name=sheet_name)
+                    df = excel_file.parse(sheet_name)
                     
                     # Generate CSV filename
-                    safe_sheet_name = re.sub(r'[<>:"/\\|?*]', '_', sheet_name)  # Replace invalid chars
+                    safe_sheet_name = sheet_name.translate(_FILENAME_TRANS)  # Replace invalid chars
                     safe_end_date = report_date.replace('-', '')
                     csv_filename = f"{ticker.upper()}-{safe_sheet_name}-{safe_end_date}.csv"
                     csv_filepath = download_dir / csv_filename
                     
                     # Export to CSV
-                    df.to_csv(csv_filepath, index=False)
-                    
-                    file_size = os.path.getsize(csv_filepath) / 1024  # Size in KB
+                    file_size = self._write_csv(df, csv_filepath) / 1024  # Size in KB
                     print(f"   ✅ Exported '{sheet_name}' to {csv_filename} ({file_size:.1f} KB)")
                     exported_count += 1
                     
@@ -459,61 +629,72 @@ class FinancialReportFinder:
         except Exception as e:
             print(f"❌ Error during CSV export: {e}")
             return 0
+        finally:
+            if owns_file and excel_file is not None:
+                excel_file.close()
     
     def download_and_process_excel(self, url, download_dir, filing_date, report_date, report_type, ticker):
         """Download Excel file and optionally export sheets to CSV"""
+        filepath = self.download_excel_file(url, download_dir, filing_date, report_date, report_type, ticker)
+        if filepath is None:
+            return False
+        
+        self.process_excel_file(filepath, download_dir, report_date, report_type, ticker)
+        return True
+    
+    def download_excel_file(self, url, download_dir, filing_date, report_date, report_type, ticker):
+        """Download an Excel report straight to disk; returns its path, or None on failure"""
         filename = self.get_safe_filename(url, filing_date, report_date, report_type, ticker)
         filepath = download_dir / filename
         
         print(f"   📥 Downloading {report_type}...")
         print(f"      └─ File: {filename}")
         
-        # Download the Excel file first
-        file_content = None
+        # Download the Excel file first, straight to disk (analysis reads it back from there)
         success = False
+        bytes_written = 0
         
         if self.render_api:
             print(f"      └─ Using SEC API...")
             try:
+                SEC_RATE_LIMITER.acquire()
                 file_content = self.render_api.get_file(url, return_binary=True)
-                success = True
+                if file_content:
+                    with open(filepath, 'wb') as f:
+                        bytes_written = f.write(file_content)
+                    success = True
+                del file_content
             except Exception as e:
                 print(f"❌ SEC API download failed: {e}")
         
         if not success:
             print(f"      └─ Using basic download...")
             try:
-                response = requests.get(url, headers=self.headers, timeout=30)
-                response.raise_for_status()
-                file_content = response.content
+                bytes_written = self._stream_to_file(url, filepath)
                 success = True
             except Exception as e:
                 print(f"❌ Basic download failed: {e}")
         
-        if not success or not file_content:
+        if not success or not bytes_written:
             print(f"      ❌ Download failed")
-            return False
-        
-        # Save the Excel file
-        with open(filepath, 'wb') as f:
-            f.write(file_content)
+            return None
         
-        file_size = os.path.getsize(filepath) / 1024  # Size in KB
+        file_size = bytes_written / 1024  # Size in KB
         print(f"      ✅ Downloaded successfully ({file_size:.1f} KB)")
-        
-        # Analyze Excel file and offer CSV export
+        return filepath
+    
+    def process_excel_file(self, filepath, download_dir, report_date, report_type, ticker):
+        """Analyze a downloaded Excel report and export the sheets the user picks to CSV"""
         if 'Excel' in report_type and self.pandas_available:
             print(f"      🔍 Analyzing Excel file structure...")
-            sheet_info = self.analyze_excel_file(file_content)
+            sheet_info = self.analyze_excel_file(filepath)
             
             if sheet_info:
                 selected_sheets = self.select_excel_sheets_to_export(sheet_info)
                 if selected_sheets:
-                    self.export_excel_sheets_to_csv(file_content, selected_sheets, download_dir, ticker, report_date)
+                    self.export_excel_sheets_to_csv(filepath, selected_sheets, download_dir, ticker, report_date)
             else:
                 print(f"      ⚠️  Could not analyze Excel file structure")
-        
-        return True
     
     def download_financial_report(self, url, download_dir, filing_date, report_date, report_type, ticker):
         """Download a single financial report with multiple methods"""
@@ -530,18 +711,18 @@ class FinancialReportFinder:
         print(f"      └─ File: {filename}")
         
         # Try SEC API first (if available), then fallback to basic method
-        success = False
+        bytes_written = 0
         
         if self.render_api:
             print(f"      └─ Using SEC API...")
-            success = self.download_file_sec_api(url, filepath)
+            bytes_written = self.download_file_sec_api(url, filepath)
         
-        if not success:
+        if not bytes_written:
             print(f"      └─ Using basic download...")
-            success = self.download_file_basic(url, filepath)
+            bytes_written = self.download_file_basic(url, filepath)
         
-        if success:
-            file_size = os.path.getsize(filepath) / 1024  # Size in KB
+        if bytes_written:
+            file_size = bytes_written / 1024  # Size in KB
             print(f"      ✅ Downloaded successfully ({file_size:.1f} KB)")
             return True
         else:
@@ -567,14 +748,34 @@ class FinancialReportFinder:
         downloaded = 0
         total = len(urls)
         
-        # Download each report
-        for report_type, url in urls.items():
-            try:
-                if self.download_financial_report(url, download_dir, filing_date, report_date, report_type, ticker):
+        # Download the reports concurrently; the session's rate limiter keeps
+        # us under SEC's 10 requests/second, so no sleep between requests.
+        # Excel reports are only downloaded here - their sheet selection prompt
+        # runs below, once the workers have stopped printing
+        excel_files = []
+        with ThreadPoolExecutor(max_workers=REPORT_DOWNLOAD_WORKERS) as pool:
+            futures = {}
+            for report_type, url in urls.items():
+                download = self.download_excel_file if 'Excel' in report_type else self.download_financial_report
+                future = pool.submit(download, url, download_dir, filing_date, report_date, report_type, ticker)
+                futures[future] = report_type
+            for future in as_completed(futures):
+                report_type = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"      ❌ Error downloading {report_type}: {e}")
+                    continue
+                if result:
                     downloaded += 1
-                time.sleep(1)  # Be respectful with requests
+                    if 'Excel' in report_type:
+                        excel_files.append((result, report_type))
+        
+        for filepath, report_type in excel_files:
+            try:
+                self.process_excel_file(filepath, download_dir, report_date, report_type, ticker)
             except Exception as e:
-                print(f"      ❌ Error downloading {report_type}: {e}")
+                print(f"      ❌ Error processing {report_type}: {e}")
         
         print(f"\n   📊 Download Summary: {downloaded}/{total} files downloaded")
         print(f"   📁 Files saved to: {download_dir}")
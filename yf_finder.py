@@ -4,13 +4,23 @@ Interactive Data Center Financial Data Extractor
 Allows users to select companies, time periods, and filing types for data extraction
 """
 
-import yfinance as yf
-import pandas as pd
+import argparse
+import csv
+import importlib.util
+import io
 import os
+import re
 from datetime import datetime, timedelta
 import logging
 from typing import Dict, List, Optional
 import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from cache import cached
+from http_utils import YAHOO_RATE_LIMITER
 
 # Set up logging
 logging.basicConfig(
@@ -19,13 +29,162 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Output formats for exported DataFrames (feather / parquet need pyarrow)
+OUTPUT_FORMATS = ('csv', 'feather', 'parquet')
+OUTPUT_EXTENSIONS = {'csv': '.csv', 'feather': '.feather', 'parquet': '.parquet'}
+# save_company_data keeps floats binary (snappy Parquet) when pyarrow is available
+# (find_spec checks for it without paying pyarrow's import cost at startup)
+DEFAULT_OUTPUT_FORMAT = 'parquet' if importlib.util.find_spec('pyarrow') is not None else 'csv'
+CSV_WRITE_BUFFER = 1 << 20   # 1 MB write buffer for exported CSVs
+CSV_CHUNKSIZE = 10_000       # rows per pandas to_csv chunk
+
+FETCH_WORKERS = 5            # info + three statements + history in flight at once
+SEARCH_ATTEMPTS = 2          # info lookups retried once on timeouts / connection errors
+SEARCH_RETRY_DELAY = 1       # seconds before that retry
+BATCH_WORKERS = 8            # tickers extracted in parallel by batch_extraction
+
+# DataFrames written by save_company_data: (data key, file prefix, add filing suffix)
+SAVED_FRAMES = (
+    ('income_stmt', 'income_statement', True),
+    ('balance_sheet', 'balance_sheet', True),
+    ('cash_flow', 'cash_flow', True),
+    ('historical', 'historical_data', False),
+)
+
+# Market cap display units, ascending: (divisor, suffix) for values above the divisor
+MARKET_CAP_UNITS = ((1e6, 'M'), (1e9, 'B'), (1e12, 'T'))
+_MARKET_CAP_THRESHOLDS = [divisor for divisor, _ in MARKET_CAP_UNITS]
+SEARCH_CACHE_TTL = 6 * 60 * 60  # company lookups served from the on-disk cache for 6 hours
+
+
+def format_market_cap(market_cap):
+    """Format a market cap as $1.23T / $4.56B / $7.89M, or 'N/A' if it isn't a number"""
+    if not isinstance(market_cap, (int, float)):
+        return 'N/A'
+    # Number of thresholds strictly below the value picks the unit
+    unit = bisect_left(_MARKET_CAP_THRESHOLDS, market_cap)
+    if unit == 0:
+        return f"${market_cap:,.0f}"
+    divisor, suffix = MARKET_CAP_UNITS[unit - 1]
+    return f"${market_cap/divisor:.2f}{suffix}"
+
+
+def _downcast(frame):
+    """Shrink numeric columns to the smallest dtype that holds every value exactly"""
+    import pandas as pd
+    
+    if isinstance(frame, pd.Series):
+        return frame
+    
+    dtypes = {}
+    for col in frame.select_dtypes('float64').columns:
+        values = frame[col]
+        # Dollar amounts often exceed float32's ~7 significant digits - keep those as float64
+        if values.astype('float32').astype('float64').equals(values):
+            dtypes[col] = 'float32'
+    for col in frame.select_dtypes('integer').columns:
+        dtypes[col] = pd.to_numeric(frame[col], downcast='integer').dtype
+    
+    # astype with a dict works for Timestamp column labels (statement periods) too
+    return frame.astype(dtypes) if dtypes else frame
+
+
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+
+def _parse_date(value):
+    """Parse YYYY-MM-DD into a datetime, raising ValueError if it isn't a valid date"""
+    match = _DATE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid date: {value!r}, expected YYYY-MM-DD")
+    return datetime(int(match[1]), int(match[2]), int(match[3]))
+
+
+def _is_transient_error(error):
+    """True for timeouts / dropped connections, from requests or yfinance's curl_cffi session"""
+    transient = (requests.Timeout, requests.ConnectionError)
+    try:
+        # yfinance talks to Yahoo through curl_cffi, whose errors don't subclass requests'
+        from curl_cffi.requests import exceptions as curl_exceptions
+        transient += (curl_exceptions.Timeout, curl_exceptions.ConnectionError)
+    except (ImportError, AttributeError):
+        pass
+    
+    try:
+        from yfinance.exceptions import YFRateLimitError
+    except ImportError:
+        YFRateLimitError = ()
+    # Retrying straight into a rate limit only gets rejected again
+    return isinstance(error, transient) and not isinstance(error, YFRateLimitError)
+
+
+def _unique_years_desc(dates):
+    """Distinct years of a date index (or statement columns), newest first"""
+    import pandas as pd
+    
+    return pd.DatetimeIndex(dates).year.unique().sort_values(ascending=False).tolist()
+
+
+def _to_arrow_frame(data):
+    """Flatten a DataFrame / Series into the shape Arrow formats accept"""
+    import pandas as pd
+    
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    # Arrow needs a default index, string column names and single-typed columns
+    frame = frame.reset_index()
+    frame.columns = [str(col) for col in frame.columns]
+    mixed = [col for col in frame.columns if frame[col].dtype == object]
+    return frame.astype({col: str for col in mixed}) if mixed else frame
+
+
+def dataframe_bytes(data, fmt='csv'):
+    """Serialize a DataFrame / Series as CSV, Feather (Arrow IPC) or Parquet bytes"""
+    if fmt == 'csv':
+        return data.to_csv(chunksize=CSV_CHUNKSIZE, date_format="%Y-%m-%d").encode('utf-8')
+    
+    buffer = io.BytesIO()
+    if fmt == 'feather':
+        _to_arrow_frame(data).to_feather(buffer)
+    elif fmt == 'parquet':
+        _to_arrow_frame(data).to_parquet(buffer)
+    else:
+        raise ValueError(f"Unsupported output format: {fmt}")
+    return buffer.getvalue()
+
+
+def write_dataframe(data, path, fmt='csv'):
+    """
+    Write a DataFrame / Series to path as CSV, Feather or Parquet
+    
+    Args:
+        data: DataFrame or Series to write
+        path: Destination file path
+        fmt (str): One of OUTPUT_FORMATS
+        
+    Returns:
+        int: Number of bytes written
+    """
+    if fmt == 'csv':
+        # One large buffered handle; chunked writes keep pandas on its C writer
+        with open(path, 'w', newline='', buffering=CSV_WRITE_BUFFER) as f:
+            data.to_csv(f, chunksize=CSV_CHUNKSIZE, date_format="%Y-%m-%d")
+            return f.tell()
+    
+    payload = dataframe_bytes(data, fmt)
+    with open(path, 'wb') as f:
+        return f.write(payload)
+
+
 class DataCenterExtractor:
-    def __init__(self):
+    def __init__(self, output_format: str = DEFAULT_OUTPUT_FORMAT):
         """Initialize the Data Center Extractor"""
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.output_format = output_format
+        
         # Create data directory
         self.data_dir = './financial_data'
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
         
         # Define filing types
         self.filing_types = {
@@ -35,105 +194,118 @@ class DataCenterExtractor:
             'DEF 14A': 'Proxy Statement',
             'S-1': 'Registration Statement'
         }
+        
+        # Shared pool for the per-ticker statement / history requests
+        self._fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="yf-fetch")
+    
+    def _ticker(self, symbol: str):
+        """Create a yf.Ticker on yfinance's own (browser-impersonating curl_cffi) session"""
+        # yfinance (and pandas with it) is imported on first use so the CLI prompt
+        # appears without waiting on those imports
+        import yfinance as yf
+        
+        # Never pass session=: yfinance keeps one process-wide session, so a plain
+        # requests.Session would replace its curl_cffi one for every Ticker (GUI included)
+        return yf.Ticker(symbol)
+    
+    def _fetch(self, fetch):
+        """Run one yfinance call (a zero-argument callable) under YAHOO_RATE_LIMITER's 2 calls/s"""
+        YAHOO_RATE_LIMITER.acquire()
+        return fetch()
     
     def search_company(self, query: str) -> Optional[Dict]:
         """Search for a company by name or ticker with enhanced information"""
-        try:
-            # Try to get company info directly
-            company = yf.Ticker(query)
-            info = company.info
-            
-            if info and 'symbol' in info:
-                # Extract comprehensive company information
-                company_data = {
-                    'ticker': info.get('symbol', query.upper()),
-                    'name': info.get('longName') or info.get('shortName') or query.upper(),
-                    'sector': info.get('sector', 'N/A'),
-                    'industry': info.get('industry', 'N/A'),
-                    'country': info.get('country', 'N/A'),
-                    'city': info.get('city', 'N/A'),
-                    'website': info.get('website', 'N/A'),
-                    'business_summary': info.get('longBusinessSummary', 'N/A')[:200] + '...' if info.get('longBusinessSummary') else 'N/A',
-                    'market_cap': info.get('marketCap', 'N/A'),
-                    'employees': info.get('fullTimeEmployees', 'N/A'),
-                    'exchange': info.get('exchange', 'N/A')
-                }
+        return self._search_company_info(query)
+    
+    def _company_data_from_info(self, info: Dict, query: str) -> Dict:
+        """Build the company_data dict from yf.Ticker().info"""
+        company_data = {
+            'ticker': info.get('symbol', query.upper()),
+            'name': info.get('longName') or info.get('shortName') or query.upper(),
+            'sector': info.get('sector', 'N/A'),
+            'industry': info.get('industry', 'N/A'),
+            'country': info.get('country', 'N/A'),
+            'city': info.get('city', 'N/A'),
+            'website': info.get('website', 'N/A'),
+            'business_summary': info.get('longBusinessSummary', 'N/A')[:200] + '...' if info.get('longBusinessSummary') else 'N/A',
+            'market_cap': info.get('marketCap', 'N/A'),
+            'employees': info.get('fullTimeEmployees', 'N/A'),
+            'exchange': info.get('exchange', 'N/A')
+        }
+        
+        # Format market cap for better display
+        company_data['market_cap_formatted'] = format_market_cap(company_data['market_cap'])
+        
+        # Format employee count
+        if isinstance(company_data['employees'], (int, float)):
+            company_data['employees_formatted'] = f"{company_data['employees']:,}"
+        else:
+            company_data['employees_formatted'] = 'N/A'
+        
+        return company_data
+    
+    def _search_company_info(self, query: str) -> Optional[Dict]:
+        """Single-symbol lookup through yf.Ticker().info (quoteSummary)"""
+        for attempt in range(SEARCH_ATTEMPTS):
+            try:
+                # Try to get company info directly
+                company = self._ticker(query)
+                info = self._fetch(lambda: company.info)
                 
-                # Format market cap for better display
-                if isinstance(company_data['market_cap'], (int, float)):
-                    if company_data['market_cap'] > 1e12:
-                        company_data['market_cap_formatted'] = f"${company_data['market_cap']/1e12:.2f}T"
-                    elif company_data['market_cap'] > 1e9:
-                        company_data['market_cap_formatted'] = f"${company_data['market_cap']/1e9:.2f}B"
-                    elif company_data['market_cap'] > 1e6:
-                        company_data['market_cap_formatted'] = f"${company_data['market_cap']/1e6:.2f}M"
-                    else:
-                        company_data['market_cap_formatted'] = f"${company_data['market_cap']:,.0f}"
-                else:
-                    company_data['market_cap_formatted'] = 'N/A'
+                if info and 'symbol' in info:
+                    return self._company_data_from_info(info, query)
                 
-                # Format employee count
-                if isinstance(company_data['employees'], (int, float)):
-                    company_data['employees_formatted'] = f"{company_data['employees']:,}"
-                else:
-                    company_data['employees_formatted'] = 'N/A'
+                return None
                 
-                return company_data
-            
-            return None
-            
-        except Exception as e:
-            logging.error(f"Error searching for company {query}: {str(e)}")
-            # Fallback to basic search
-            try:
-                company = yf.Ticker(query)
-                info = company.info
-                if info and info.get('symbol'):
-                    return {
-                        'ticker': info.get('symbol', query.upper()),
-                        'name': info.get('shortName', query.upper()),
-                        'sector': 'N/A',
-                        'industry': 'N/A'
-                    }
-            except:
-                pass
+            except Exception as e:
+                # Only transient network failures are worth a second try
+                if attempt + 1 < SEARCH_ATTEMPTS and _is_transient_error(e):
+                    time.sleep(SEARCH_RETRY_DELAY)
+                    continue
+                logging.error(f"Error searching for company {query}: {str(e)}")
             return None
     
     def get_available_periods(self, ticker: str) -> Dict:
         """Get available time periods for a company with enhanced period detection"""
         try:
-            company = yf.Ticker(ticker)
+            import pandas as pd
+            
+            company = self._ticker(ticker)
             
-            # Get historical data to determine available periods
-            hist = company.history(period="max")
+            # A few recent days give the latest date; the chart metadata returned with
+            # them carries the first trade date, so the full daily history isn't needed
+            hist = self._fetch(lambda: company.history(period="5d"))
             
             if hist.empty:
                 return {}
             
-            # Get unique years and quarters with more comprehensive analysis
-            years = sorted(hist.index.year.unique(), reverse=True)
-            quarters = sorted(hist.index.quarter.unique(), reverse=True)
+            latest_date = hist.index.max()
+            first_trade = (getattr(company, 'history_metadata', None) or {}).get('firstTradeDate')
+            if first_trade:
+                earliest_date = pd.to_datetime(first_trade, unit='s', utc=True)
+                if hist.index.tz is not None:
+                    earliest_date = earliest_date.tz_convert(hist.index.tz)
+                else:
+                    earliest_date = earliest_date.tz_localize(None)
+            else:
+                earliest_date = hist.index.min()
+            
+            years = list(range(latest_date.year, earliest_date.year - 1, -1))
             
             # Try to get actual financial statement dates
             try:
                 # Get quarterly financials to see actual reporting periods
-                quarterly_financials = company.quarterly_financials
-                annual_financials = company.financials
+                quarterly_financials = self._fetch(lambda: company.quarterly_financials)
+                annual_financials = self._fetch(lambda: company.financials)
                 
-                actual_quarters = []
-                actual_years = []
-                
-                if not quarterly_financials.empty:
-                    actual_quarters = sorted([col.year for col in quarterly_financials.columns], reverse=True)
-                
-                if not annual_financials.empty:
-                    actual_years = sorted([col.year for col in annual_financials.columns], reverse=True)
+                actual_quarters = _unique_years_desc(quarterly_financials.columns) if not quarterly_financials.empty else []
+                actual_years = _unique_years_desc(annual_financials.columns) if not annual_financials.empty else []
                 
                 # Use actual financial periods if available
                 if actual_years:
                     years = actual_years[:10]  # Last 10 years
                 if actual_quarters:
-                    years_with_quarters = sorted(list(set(actual_quarters)), reverse=True)[:5]  # Last 5 years with quarterly data
+                    years_with_quarters = actual_quarters[:5]  # Last 5 years with quarterly data
                 else:
                     years_with_quarters = years[:5]
                     
@@ -145,9 +317,10 @@ class DataCenterExtractor:
                 'years': years[:10],  # Last 10 years for annual
                 'years_with_quarters': years_with_quarters,  # Years with quarterly data
                 'quarters': [1, 2, 3, 4],  # Standard quarters
-                'earliest_date': hist.index.min(),
-                'latest_date': hist.index.max(),
-                'data_points': len(hist)
+                'earliest_date': earliest_date,
+                'latest_date': latest_date,
+                # Business days between the two dates (exchange holidays included), not a row count
+                'approx_trading_days': len(pd.bdate_range(earliest_date.normalize(), latest_date.normalize()))
             }
             
         except Exception as e:
@@ -157,42 +330,53 @@ class DataCenterExtractor:
     def get_company_data(self, ticker: str, start_date: str = None, end_date: str = None, filing_type: str = None) -> Optional[Dict]:
         """Get financial data for a company within specified period with enhanced error handling"""
         try:
-            company = yf.Ticker(ticker)
+            company = self._ticker(ticker)
+            
+            # Each property is its own HTTP request - issue them all at once so the
+            # wall time is the slowest request rather than the sum of all five
+            if filing_type == 'quarterly':
+                statements = {
+                    'income_stmt': lambda: company.quarterly_income_stmt,
+                    'balance_sheet': lambda: company.quarterly_balance_sheet,
+                    'cash_flow': lambda: company.quarterly_cashflow
+                }
+            else:
+                # Default to annual
+                statements = {
+                    'income_stmt': lambda: company.income_stmt,
+                    'balance_sheet': lambda: company.balance_sheet,
+                    'cash_flow': lambda: company.cashflow
+                }
+            
+            if start_date and end_date:
+                history = lambda: company.history(start=start_date, end=end_date)
+            else:
+                history = lambda: company.history(period="1y")
             
-            # Get basic info
-            info = company.info
+            info_future = self._fetch_pool.submit(self._fetch, lambda: company.info)
+            statement_futures = {key: self._fetch_pool.submit(self._fetch, fetch) for key, fetch in statements.items()}
+            history_future = self._fetch_pool.submit(self._fetch, history)
             
             # Initialize result dictionary
             result = {
-                'info': info,
+                'info': info_future.result(),
                 'income_stmt': None,
                 'balance_sheet': None,
                 'cash_flow': None,
                 'historical': None
             }
             
-            # Get financial statements based on filing type
-            try:
-                if filing_type == 'quarterly':
-                    result['income_stmt'] = company.quarterly_income_stmt
-                    result['balance_sheet'] = company.quarterly_balance_sheet
-                    result['cash_flow'] = company.quarterly_cashflow
-                else:
-                    # Default to annual
-                    result['income_stmt'] = company.income_stmt
-                    result['balance_sheet'] = company.balance_sheet
-                    result['cash_flow'] = company.cashflow
-                    
-            except Exception as e:
-                logging.warning(f"Error fetching financial statements for {ticker}: {str(e)}")
-                # Continue with other data even if financials fail
+            # Collect financial statements
+            for key, future in statement_futures.items():
+                try:
+                    result[key] = future.result()
+                except Exception as e:
+                    logging.warning(f"Error fetching financial statements for {ticker}: {str(e)}")
+                    # Continue with other data even if financials fail
             
-            # Get historical data for the period
+            # Collect historical data for the period
             try:
-                if start_date and end_date:
-                    result['historical'] = company.history(start=start_date, end=end_date)
-                else:
-                    result['historical'] = company.history(period="1y")
+                result['historical'] = history_future.result()
             except Exception as e:
                 logging.warning(f"Error fetching historical data for {ticker}: {str(e)}")
             
@@ -216,11 +400,10 @@ class DataCenterExtractor:
             return None
     
     def save_company_data(self, ticker: str, data: Dict, filing_type: str = None):
-        """Save company data to CSV files with enhanced file naming"""
+        """Save company data in self.output_format (info stays CSV) with enhanced file naming"""
         try:
             company_dir = os.path.join(self.data_dir, ticker)
-            if not os.path.exists(company_dir):
-                os.makedirs(company_dir)
+            os.makedirs(company_dir, exist_ok=True)
             
             # Create timestamp for file naming
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -228,52 +411,28 @@ class DataCenterExtractor:
             
             # Save financial statements with better error handling
             files_saved = []
+            extension = OUTPUT_EXTENSIONS[self.output_format]
             
-            if data.get('income_stmt') is not None and not data['income_stmt'].empty:
-                filename = f'income_statement{filing_suffix}_{timestamp}.csv'
-                filepath = os.path.join(company_dir, filename)
-                data['income_stmt'].to_csv(filepath)
-                files_saved.append(filename)
-            
-            if data.get('balance_sheet') is not None and not data['balance_sheet'].empty:
-                filename = f'balance_sheet{filing_suffix}_{timestamp}.csv'
-                filepath = os.path.join(company_dir, filename)
-                data['balance_sheet'].to_csv(filepath)
-                files_saved.append(filename)
-            
-            if data.get('cash_flow') is not None and not data['cash_flow'].empty:
-                filename = f'cash_flow{filing_suffix}_{timestamp}.csv'
-                filepath = os.path.join(company_dir, filename)
-                data['cash_flow'].to_csv(filepath)
-                files_saved.append(filename)
-            
-            if data.get('historical') is not None and not data['historical'].empty:
-                filename = f'historical_data_{timestamp}.csv'
-                filepath = os.path.join(company_dir, filename)
-                data['historical'].to_csv(filepath)
-                files_saved.append(filename)
+            for key, prefix, suffixed in SAVED_FRAMES:
+                frame = data.get(key)
+                if frame is not None and not frame.empty:
+                    filename = f'{prefix}{filing_suffix if suffixed else ""}_{timestamp}{extension}'
+                    # write_dataframe streams through one large buffer instead of many small writes
+                    write_dataframe(_downcast(frame), os.path.join(company_dir, filename), self.output_format)
+                    files_saved.append(filename)
             
             # Save company info with enhanced formatting
             if data.get('info') and len(data['info']) > 0:
                 filename = f'company_info_{timestamp}.csv'
                 filepath = os.path.join(company_dir, filename)
                 
-                # Create a more readable company info file
-                info_series = pd.Series(data['info'])
-                # Filter out None values and convert problematic types
-                clean_info = {}
-                for key, value in info_series.items():
-                    if value is not None:
-                        try:
-                            # Convert to string if it's a complex type
-                            if isinstance(value, (list, dict)):
-                                clean_info[key] = str(value)
-                            else:
-                                clean_info[key] = value
-                        except:
-                            clean_info[key] = str(value)
-                
-                pd.Series(clean_info).to_csv(filepath)
+                # Write key,value rows straight from the dict, skipping None values and
+                # stringifying complex types (same layout as pd.Series.to_csv)
+                with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(['', '0'])
+                    writer.writerows((key, str(value) if isinstance(value, (list, dict)) else value)
+                                     for key, value in data['info'].items() if value is not None)
                 files_saved.append(filename)
             
             if files_saved:
@@ -287,6 +446,44 @@ class DataCenterExtractor:
             logging.error(f"Error saving data for {ticker}: {str(e)}")
             return []
     
+    def _process_one(self, ticker: str, start_date: str = None, end_date: str = None, filing_type: str = None) -> List[str]:
+        """Fetch and save one ticker, returning the saved file names"""
+        data = self.get_company_data(ticker, start_date, end_date, filing_type)
+        if not data:
+            return []
+        return self.save_company_data(ticker, data, filing_type)
+    
+    def batch_extraction(self, tickers: List[str], start_date: str = None, end_date: str = None, filing_type: str = None) -> Dict[str, List[str]]:
+        """
+        Extract and save data for several tickers in parallel
+        
+        Args:
+            tickers (List[str]): Ticker symbols to extract
+            start_date (str): Start date (YYYY-MM-DD), or None for the last year
+            end_date (str): End date (YYYY-MM-DD), or None for today
+            filing_type (str): 'annual' or 'quarterly'
+            
+        Returns:
+            dict: ticker -> list of saved file names (empty when nothing was saved)
+        """
+        results = {}
+        # Every yfinance call takes a YAHOO_RATE_LIMITER token in _fetch (2 calls/s), so the
+        # workers overlap waits without bursting; one call may cost a few HTTP requests
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+            futures = {pool.submit(self._process_one, ticker, start_date, end_date, filing_type): ticker
+                       for ticker in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    results[ticker] = future.result()
+                except Exception as e:
+                    logging.error(f"Error in batch extraction for {ticker}: {str(e)}")
+                    results[ticker] = []
+                
+                status = f"✅ {len(results[ticker])} files" if results[ticker] else "❌ no data"
+                print(f"   {ticker}: {status}")
+        return results
+    
     def interactive_extraction(self):
         """Interactive data extraction process with enhanced user experience"""
         print("\n=== Enhanced Data Center Financial Data Extractor ===")
@@ -296,7 +493,16 @@ class DataCenterExtractor:
         print("  Date format: YYYY-MM-DD (e.g., 2023-01-01)")
         print("="*60)
         
+        # Smart default start dates, computed once per session
+        session_start = datetime.now()
+        default_starts = {
+            'quarterly': (session_start - timedelta(days=365)).strftime("%Y-%m-%d"),  # 1 year ago
+            'annual': (session_start - timedelta(days=365*3)).strftime("%Y-%m-%d")  # 3 years ago
+        }
+        
         while True:
+            today_str = datetime.now().strftime("%Y-%m-%d")
+            
             # Get company input
             company_input = input("\n📊 Enter company name or ticker (or 'quit' to exit): ").strip()
             if company_input.lower() == 'quit':
@@ -328,7 +534,7 @@ class DataCenterExtractor:
                 continue
             
             print(f"\n📅 Available time periods:")
-            print(f"   📊 Data points: {periods.get('data_points', 'Unknown')}")
+            print(f"   📊 Approx. trading days: {periods.get('approx_trading_days', 'Unknown')}")
             print(f"   📈 Date range: {periods.get('earliest_date', 'Unknown').strftime('%Y-%m-%d') if periods.get('earliest_date') else 'Unknown'} to {periods.get('latest_date', 'Unknown').strftime('%Y-%m-%d') if periods.get('latest_date') else 'Unknown'}")
             
             if periods.get('years'):
@@ -357,10 +563,10 @@ class DataCenterExtractor:
             
             # Smart default dates based on filing type
             if filing_type == "quarterly":
-                default_start = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")  # 1 year ago
+                default_start = default_starts['quarterly']
                 print(f"   💡 Suggestion: Last year for quarterly data")
             else:
-                default_start = (datetime.now() - timedelta(days=365*3)).strftime("%Y-%m-%d")  # 3 years ago
+                default_start = default_starts['annual']
                 print(f"   💡 Suggestion: Last 3 years for annual data")
             
             while True:
@@ -369,7 +575,7 @@ class DataCenterExtractor:
                     start_date = default_start
                     break
                 try:
-                    datetime.strptime(start_date, "%Y-%m-%d")
+                    _parse_date(start_date)
                     break
                 except ValueError:
                     print("❌ Invalid date format. Please use YYYY-MM-DD (e.g., 2023-01-01)")
@@ -377,10 +583,10 @@ class DataCenterExtractor:
             while True:
                 end_date = input("📅 End date (press Enter for today): ").strip()
                 if not end_date:
-                    end_date = datetime.now().strftime("%Y-%m-%d")
+                    end_date = today_str
                     break
                 try:
-                    datetime.strptime(end_date, "%Y-%m-%d")
+                    _parse_date(end_date)
                     break
                 except ValueError:
                     print("❌ Invalid date format. Please use YYYY-MM-DD (e.g., 2023-12-31)")
@@ -436,14 +642,35 @@ class DataCenterExtractor:
 
 def main():
     """Main function with enhanced startup"""
+    parser = argparse.ArgumentParser(description="Extract financial data from Yahoo Finance")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Always look companies up on Yahoo instead of the local cache")
+    parser.add_argument('--tickers', nargs='+', metavar='TICKER',
+                        help="Extract these tickers in one batch instead of prompting")
+    parser.add_argument('--filing-type', choices=['annual', 'quarterly'], default='annual',
+                        help="Statement frequency for --tickers (default: annual)")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default=DEFAULT_OUTPUT_FORMAT,
+                        help=f"File format for saved statements (default: {DEFAULT_OUTPUT_FORMAT})")
+    args = parser.parse_args()
+    
     print("🚀 Enhanced Financial Data Extractor")
     print("=" * 50)
     print("📊 Extract comprehensive financial data from Yahoo Finance")
     print("🔍 Enhanced with detailed company information and smart defaults")
     print("=" * 50)
     
-    extractor = DataCenterExtractor()
-    extractor.interactive_extraction()
+    print(f"💾 Saving statements as {args.format.upper()} ({OUTPUT_EXTENSIONS[args.format]}) - change with --format")
+    
+    extractor = DataCenterExtractor(output_format=args.format)
+    if not args.no_cache:
+        # yfinance refuses caching sessions (requests_cache), so cache the company
+        # lookups at the result level; statements and history are always fetched live
+        extractor.search_company = cached(SEARCH_CACHE_TTL)(extractor.search_company)
+    if args.tickers:
+        print(f"🔄 Extracting {len(args.tickers)} tickers...")
+        extractor.batch_extraction([ticker.upper() for ticker in args.tickers], filing_type=args.filing_type)
+    else:
+        extractor.interactive_extraction()
 
 
 if __name__ == "__main__":